@@ -1,33 +1,366 @@
 from __future__ import annotations
 
-from importlib.resources import files
+import heapq
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from itertools import groupby
+from tempfile import TemporaryFile
+from typing import IO, TYPE_CHECKING, Iterable, Iterator, TypeAlias
 
-from . import print_day
+from . import import_numpy, print_day
+from .puzzle_input import PuzzleInput, get_input
 
+if TYPE_CHECKING:
+    import numpy as np
+
+TITLE = "Historian Hysteria"
+
+# the default memory `solve_stream` may use for the location IDs, larger inputs are sorted in runs on disk
+MEMORY_BUDGET = 256 * 1024 * 1024
+# the memory of one ID while a run is sorted: 8 bytes in the array, plus the int object and its pointer in the list
+BYTES_PER_ID = 8 + 28 + 8
+
+
+# sorted location IDs, either as a list or as a NumPy array if NumPy is installed
+LocationIds: TypeAlias = "list[int] | np.ndarray"
+
+
+def parse(input: PuzzleInput) -> tuple[LocationIds, LocationIds]:
+    if import_numpy() is not None:
+        return parse_array(input.buffer())
+    # the lines are parsed straight from the memory-mapped input, without decoding the whole input first
+    return parse_lines(input.lines())
+
+
+def parse_array(buffer: memoryview) -> tuple[np.ndarray, np.ndarray]:
+    np = import_numpy()
+    # all IDs are parsed at once, alternating between the left and the right list
+    ids = np.fromstring(bytes(buffer), dtype=np.int64, sep=" ").reshape(-1, 2)
+    return np.sort(ids[:, 0]), np.sort(ids[:, 1])
 
-def main():
-    print_day(1, "Historian Hysteria")
 
+def parse_lines(lines: Iterable[bytes]) -> tuple[LocationIds, LocationIds]:
     left = []
     right = []
-
-    with (files("solutions.inputs") / "01.txt").open() as file:
-        for line in file:
-            a, b = map(int, line.split())
-            left.append(a)
-            right.append(b)
+    for line in lines:
+        a, b = line.split()
+        left.append(int(a))
+        right.append(int(b))
     left.sort()
     right.sort()
+    return left, right
 
-    # Part One: Finding the total distance between the lists
+
+def part_one(lists: tuple[LocationIds, LocationIds]) -> int:
+    left, right = lists
+    if not isinstance(left, list):
+        return int(abs(left - right).sum())
     distances = [abs(a - b) for a, b in zip(left, right)]
-    total_distance = sum(distances)
-    print(f"Total distance: {total_distance}")
+    return sum(distances)
+
+
+def part_two(lists: tuple[LocationIds, LocationIds]) -> int:
+    left, right = lists
+    if not isinstance(left, list):
+        # the right list is sorted, so the occurrences of an ID are the range between its first and last position
+        counts = right.searchsorted(left, side="right") - right.searchsorted(left, side="left")
+        return int((left * counts).sum())
+    counts = Counter(right)
+    similarities = [a * counts[a] for a in left]
+    return sum(similarities)
+
+
+def write_run(ids: array) -> IO[bytes]:
+    file = TemporaryFile()
+    array("q", sorted(ids)).tofile(file)
+    return file
+
+
+def read_run(file: IO[bytes], block_size: int) -> Iterator[int]:
+    file.seek(0)
+    while True:
+        block = array("q")
+        try:
+            block.fromfile(file, block_size)
+        except EOFError:
+            # the last block is shorter, but still contains the remaining IDs
+            yield from block
+            return
+        yield from block
+
+
+def merge_runs(files: list[IO[bytes]], block_size: int) -> Iterator[int]:
+    return heapq.merge(*(read_run(file, block_size) for file in files))
+
+
+def count_ids(ids: Iterator[int]) -> Iterator[tuple[int, int]]:
+    for location_id, group in groupby(ids):
+        yield location_id, sum(1 for _ in group)
+
+
+def similarity_score(left: Iterator[int], right: Iterator[int]) -> int:
+    """
+    Calculates the similarity score of two sorted streams of location IDs by joining their counts.
+    """
+
+    score = 0
+    right_counts = count_ids(right)
+    right_id, right_count = next(right_counts, (math.inf, 0))
+    for location_id, count in count_ids(left):
+        while right_id < location_id:
+            right_id, right_count = next(right_counts, (math.inf, 0))
+        if right_id == location_id:
+            score += location_id * count * right_count
+    return score
+
+
+def solve_stream(lines: Iterable[bytes], *, memory_budget: int = MEMORY_BUDGET) -> tuple[int, int]:
+    """
+    Solves both parts without keeping more than roughly `memory_budget` bytes of location IDs in memory.
+
+    If the lists don't fit into the budget, they are split into runs, which are sorted and written to temporary files.
+    The total distance and the similarity score are then calculated while merging the sorted runs.
+    """
+
+    run_length = max(1, memory_budget // (2 * BYTES_PER_ID))
+    left_runs: list[IO[bytes]] = []
+    right_runs: list[IO[bytes]] = []
+    try:
+        left, right = array("q"), array("q")
+        for line in lines:
+            a, b = line.split()
+            left.append(int(a))
+            right.append(int(b))
+            if len(left) == run_length:
+                left_runs.append(write_run(left))
+                right_runs.append(write_run(right))
+                left, right = array("q"), array("q")
+
+        if not left_runs:
+            # everything fits into the budget
+            lists = sorted(left), sorted(right)
+            return part_one(lists), part_two(lists)
+
+        if left:
+            left_runs.append(write_run(left))
+            right_runs.append(write_run(right))
+        del left, right
+
+        # every run of both lists gets a block of the budget to read into
+        block_size = max(1, memory_budget // (2 * len(left_runs) * array("q").itemsize))
+        distance = sum(
+            abs(a - b) for a, b in zip(merge_runs(left_runs, block_size), merge_runs(right_runs, block_size))
+        )
+        similarity = similarity_score(merge_runs(left_runs, block_size), merge_runs(right_runs, block_size))
+        return distance, similarity
+    finally:
+        for file in left_runs + right_runs:
+            file.close()
+
+
+class DifferenceBlock:
+    """
+    A block of consecutive segments of the difference D(x) = (number of left IDs <= x) - (number of right IDs <= x).
+
+    Segment `i` starts at `points[i]` and ends at the next point, or at `end` for the last segment of the block. If
+    `end` is None, the block is the last one and its last segment extends to infinity, where D is always 0. The values
+    are stored relative to `shift`, so that all segments of the block can be shifted at once in constant time.
+    """
+
+    points: list[int]
+    values: list[int]
+    end: int | None
+    shift: int
+    # the total length of the segments with each stored value
+    weights: dict[int, int]
+    length: int
+    # the total length of the segments where D is negative
+    negative: int
+    # the sum of |D| over the whole block, i.e. this block's share of the total distance
+    distance: int
+
+    def __init__(self, points: list[int], values: list[int], end: int | None) -> None:
+        self.points = points
+        self.values = values
+        self.end = end
+        self.shift = 0
+        self.weights = {}
+        self.length = self.negative = self.distance = 0
+        for i, value in enumerate(values):
+            self.__add_weight(value, self.segment_length(i))
+
+    def segment_length(self, i: int) -> int:
+        end = self.points[i + 1] if i + 1 < len(self.points) else self.end
+        return end - self.points[i] if end is not None else 0
+
+    def __add_weight(self, value: int, length: int) -> None:
+        self.weights[value] = self.weights.get(value, 0) + length
+        self.length += length
+        actual = value + self.shift
+        self.distance += abs(actual) * length
+        if actual < 0:
+            self.negative += length
+
+    def insert(self, point: int) -> None:
+        """
+        Splits the segment containing `point` at that point, or adds a new segment in front of the first one.
+        """
+
+        i = bisect_right(self.points, point) - 1
+        if i >= 0 and self.points[i] == point:
+            return
+        if i < 0:
+            # D is 0 in front of the first point
+            end = self.points[0] if self.points else self.end
+            self.points.insert(0, point)
+            self.values.insert(0, -self.shift)
+            self.__add_weight(-self.shift, end - point if end is not None else 0)
+            return
+        # both halves keep the value of the segment, only the length of an infinite last segment changes
+        length = self.segment_length(i)
+        self.points.insert(i + 1, point)
+        self.values.insert(i + 1, self.values[i])
+        self.__add_weight(self.values[i], self.segment_length(i) + self.segment_length(i + 1) - length)
+
+    def add(self, start: int, end: int, delta: int) -> int:
+        """
+        Adds `delta` to the segments starting in [start, end) and returns the change of the distance.
+
+        The range must not contain the infinite last segment.
+        """
+
+        points, values, weights, shift = self.points, self.values, self.weights, self.shift
+        distance = negative = 0
+        for i in range(bisect_left(points, start), bisect_left(points, end)):
+            length = (points[i + 1] if i + 1 < len(points) else self.end) - points[i]
+            value = values[i]
+            weights[value] -= length
+            values[i] = value + delta
+            weights[value + delta] = weights.get(value + delta, 0) + length
+            actual = value + shift
+            distance += (abs(actual + delta) - abs(actual)) * length
+            negative += ((actual + delta < 0) - (actual < 0)) * length
+        self.distance += distance
+        self.negative += negative
+        return distance
+
+    def add_to_all(self, delta: int) -> int:
+        """
+        Adds `delta` (1 or -1) to all segments of the block in constant time and returns the change of the distance.
+        """
+
+        distance = self.distance
+        if delta == 1:
+            # |D| grows for D >= 0 and shrinks for D < 0, and the segments with D = -1 become 0
+            self.distance += self.length - 2 * self.negative
+            self.negative -= self.weights.get(-1 - self.shift, 0)
+        else:
+            zero = self.weights.get(-self.shift, 0)
+            self.distance += 2 * (self.negative + zero) - self.length
+            self.negative += zero
+        self.shift += delta
+        return self.distance - distance
+
+    def split(self) -> tuple[DifferenceBlock, DifferenceBlock]:
+        half = len(self.points) // 2
+        values = [value + self.shift for value in self.values]
+        return (
+            DifferenceBlock(self.points[:half], values[:half], self.points[half]),
+            DifferenceBlock(self.points[half:], values[half:], self.end),
+        )
+
+
+class HistorianLists:
+    """
+    Keeps the total distance and the similarity score of two growing lists of location IDs up to date.
+
+    The similarity score is updated from the counts of the IDs in each list. The total distance is the sum of |D(x)|
+    over all x, where D(x) is the number of left IDs <= x minus the number of right IDs <= x. Adding a pair (a, b) adds
+    1 to D on [a, b) or -1 on [b, a). D is stored as segments between the added IDs, which are grouped into about
+    sqrt(n) blocks, so that each pair is added in O(sqrt(n)) time and both answers are always available in O(1).
+    """
+
+    MIN_BLOCK_SIZE = 16
+
+    similarity_score: int
+    total_distance: int
+    left_counts: Counter[int]
+    right_counts: Counter[int]
+    __blocks: list[DifferenceBlock]
+    # the first point of every block
+    __starts: list[int]
+    __points: int
+    __pairs: int
+
+    def __init__(self, pairs: Iterable[tuple[int, int]] = ()) -> None:
+        self.similarity_score = 0
+        self.total_distance = 0
+        self.left_counts = Counter()
+        self.right_counts = Counter()
+        self.__blocks = []
+        self.__starts = []
+        self.__points = 0
+        self.__pairs = 0
+        for left, right in pairs:
+            self.add(left, right)
+
+    def __len__(self) -> int:
+        return self.__pairs
+
+    def add(self, left: int, right: int) -> None:
+        self.__pairs += 1
+        self.similarity_score += left * self.right_counts[left]
+        self.left_counts[left] += 1
+        self.similarity_score += right * self.left_counts[right]
+        self.right_counts[right] += 1
+
+        if left != right:
+            self.__add_difference(min(left, right), max(left, right), 1 if left < right else -1)
+
+    def __block_index(self, point: int) -> int:
+        return max(0, bisect_right(self.__starts, point) - 1)
+
+    def __insert(self, point: int) -> None:
+        if not self.__blocks:
+            self.__blocks.append(DifferenceBlock([point], [0], None))
+            self.__starts.append(point)
+            self.__points += 1
+            return
+
+        i = self.__block_index(point)
+        block = self.__blocks[i]
+        points = len(block.points)
+        block.insert(point)
+        self.__points += len(block.points) - points
+        self.__starts[i] = block.points[0]
+
+        if len(block.points) > 2 * max(self.MIN_BLOCK_SIZE, math.isqrt(self.__points)):
+            self.__blocks[i : i + 1] = block.split()
+            self.__starts[i : i + 1] = [self.__blocks[i].points[0], self.__blocks[i + 1].points[0]]
+
+    def __add_difference(self, start: int, end: int, delta: int) -> None:
+        self.__insert(start)
+        self.__insert(end)
+        for i in range(self.__block_index(start), self.__block_index(end) + 1):
+            block = self.__blocks[i]
+            if start <= block.points[0] and block.end is not None and block.end <= end:
+                self.total_distance += block.add_to_all(delta)
+            else:
+                self.total_distance += block.add(start, end, delta)
+
+
+def main():
+    print_day(1, TITLE)
+
+    lists = parse(get_input(1))
+
+    # Part One: Finding the total distance between the lists
+    print(f"Total distance: {part_one(lists)}")
 
     # Part Two: Finding the similarity score of the lists
-    similarities = [a * right.count(a) for a in left]
-    similarity_score = sum(similarities)
-    print(f"Similarity score: {similarity_score}")
+    print(f"Similarity score: {part_two(lists)}")
 
 
 if __name__ == "__main__":
@@ -1,18 +1,141 @@
 from __future__ import annotations
 
-from importlib.resources import files
-from typing import TypeAlias
+from itertools import chain
+from typing import TYPE_CHECKING, Iterable, NamedTuple, TypeAlias
 
-from . import print_day
+from . import import_numpy, print_day
+from .parallel import map_chunks
+from .puzzle_input import PuzzleInput, get_input
+
+if TYPE_CHECKING:
+    import numpy as np
+
+TITLE = "Red-Nosed Reports"
 
 Level: TypeAlias = list[int]
 Report: TypeAlias = list[Level]
 
-reports: list[Report] = []
 
-with (files("solutions.inputs") / "02.txt").open() as file:
-    for line in file:
-        reports.append(list(map(int, line.split())))
+class PackedReports(NamedTuple):
+    """
+    Reports packed into a NumPy array for classifying all of them at once.
+
+    Every row of `levels` is one report, padded with zeros to the length of the longest report (at least 3, so that
+    there is always a pair of adjacent levels and of levels next but one to each other). `lengths` are the actual
+    numbers of levels in each report.
+    """
+
+    levels: np.ndarray
+    lengths: np.ndarray
+
+    @staticmethod
+    def from_reports(reports: Iterable[Report]) -> PackedReports:
+        np = import_numpy()
+        reports = list(reports)
+        lengths = np.fromiter(map(len, reports), dtype=np.int64, count=len(reports))
+        return PackedReports.__pack(np.fromiter(chain.from_iterable(reports), dtype=np.int64), lengths)
+
+    @staticmethod
+    def from_buffer(buffer: memoryview) -> PackedReports:
+        """
+        Packs the reports of a whole puzzle input at once, without splitting it into lines in Python.
+        """
+
+        np = import_numpy()
+        data = np.frombuffer(buffer, dtype=np.uint8)
+        if len(data) == 0:
+            return PackedReports.__pack(np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+
+        # every level starts with a digit or a minus sign that doesn't follow another one
+        is_level = ((data >= ord("0")) & (data <= ord("9"))) | (data == ord("-"))
+        level_starts = is_level & ~np.concatenate(([False], is_level[:-1]))
+        newlines = data == ord("\n")
+        number_of_reports = int(newlines.sum()) + (data[-1] != ord("\n"))
+        report_of_level = np.cumsum(newlines)[level_starts]
+        lengths = np.bincount(report_of_level, minlength=number_of_reports).astype(np.int64)
+        return PackedReports.__pack(np.fromstring(bytes(buffer), dtype=np.int64, sep=" "), lengths)
+
+    @staticmethod
+    def __pack(values: np.ndarray, lengths: np.ndarray) -> PackedReports:
+        np = import_numpy()
+        width = max(3, int(lengths.max(initial=0)))
+        levels = np.zeros((len(lengths), width), dtype=np.int64)
+        # the mask is filled row by row, i.e. in the same order as the levels of the reports
+        levels[np.arange(width) < lengths[:, None]] = values
+        return PackedReports(levels, lengths)
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def safe(self, steps: range) -> np.ndarray:
+        """
+        Returns for every report whether all its adjacent levels differ by a step in `steps`.
+        """
+
+        return self.__pairs_ok(steps).all(axis=1)
+
+    def safe_with_problem_dampener(self, steps: range) -> np.ndarray:
+        """
+        Returns for every report whether removing at most one level makes all its adjacent levels differ by a step in
+        `steps`.
+
+        Removing level k leaves the pairs in front of k-1 and behind k+1 as they are, so the report is safe if all of
+        those are ok, which is looked up in the prefix and suffix conjunctions of the pairs, and the new pair of levels
+        k-1 and k+1 bridging the removed level is ok as well.
+        """
+
+        np = import_numpy()
+        ok = self.__pairs_ok(steps)
+        rows, width = self.levels.shape
+        true = np.ones((rows, 1), dtype=bool)
+
+        # prefix[:, k] tells if all pairs in front of k-1 are ok, suffix[:, k] if all pairs from k+1 on are ok
+        prefix = np.concatenate((true, true, np.logical_and.accumulate(ok, axis=1)[:, :-1]), axis=1)
+        suffix = np.concatenate((np.logical_and.accumulate(ok[:, ::-1], axis=1)[:, ::-1], true, true), axis=1)[:, 1:]
+
+        bridges = self.levels[:, 2:] - self.levels[:, :-2]
+        bridge_ok = (bridges >= steps.start) & (bridges < steps.stop)
+        # the first and the last level don't need a bridge
+        has_bridge = np.arange(1, width - 1) < (self.lengths[:, None] - 1)
+        bridge_ok = np.concatenate((true, bridge_ok | ~has_bridge, true), axis=1)
+
+        removable = prefix & suffix & bridge_ok & (np.arange(width) < self.lengths[:, None])
+        return removable.any(axis=1)
+
+    def __pairs_ok(self, steps: range) -> np.ndarray:
+        np = import_numpy()
+        differences = self.levels[:, 1:] - self.levels[:, :-1]
+        # the padding behind the last level of a report is always ok
+        is_padding = np.arange(1, self.levels.shape[1]) >= self.lengths[:, None]
+        return ((differences >= steps.start) & (differences < steps.stop)) | is_padding
+
+
+def parse(input: PuzzleInput) -> list[Report] | PackedReports:
+    if import_numpy() is not None:
+        return PackedReports.from_buffer(input.buffer())
+    return [list(map(int, line.split())) for line in input.lines()]
+
+
+# the allowed differences between adjacent levels of a safe report
+INCREASING = range(1, 4)
+DECREASING = range(-3, 0)
+
+
+def find_unsafe_level(report: Report, steps: range, *, skip: int | None = None) -> int | None:
+    """
+    Finds the first level whose difference to the next level is not in `steps`, ignoring the level at index `skip`.
+
+    Returns the index of that level or None if all differences are in `steps`.
+    """
+
+    previous = None
+    for i, level in enumerate(report):
+        if i == skip:
+            continue
+        if previous is not None and level - report[previous] not in steps:
+            return previous
+        previous = i
+    return None
 
 
 def is_report_safe(report: Report) -> bool:
@@ -24,13 +147,7 @@ def is_report_safe(report: Report) -> bool:
     - any two adjacent levels differ by at least one and at most three
     """
 
-    all_increasing = all(report[i] < report[i + 1] for i in range(len(report) - 1))
-    all_decreasing = all(report[i] > report[i + 1] for i in range(len(report) - 1))
-    adjacent_distance = all(
-        1 <= abs(report[i + 1] - report[i]) <= 3 for i in range(len(report) - 1)
-    )
-
-    return (all_increasing or all_decreasing) and adjacent_distance
+    return find_unsafe_level(report, INCREASING) is None or find_unsafe_level(report, DECREASING) is None
 
 
 def is_report_safe_with_problem_dampener(report: Report) -> bool:
@@ -39,31 +156,86 @@ def is_report_safe_with_problem_dampener(report: Report) -> bool:
 
     The Problem Dampener can remove one level from the report to make it safe.
     The same rules apply as in is_report_safe.
+
+    Removing any level in front of the first unsafe pair of levels, or behind it, leaves that pair unsafe. So only the
+    two levels of the first unsafe pair are candidates for removal, which makes the check linear in the report length.
     """
 
-    for i in range(len(report)):
-        if is_report_safe(report[:i] + report[i + 1 :]):
+    if not report:
+        return False
+
+    for steps in (INCREASING, DECREASING):
+        i = find_unsafe_level(report, steps)
+        if (
+            i is None
+            or find_unsafe_level(report, steps, skip=i) is None
+            or find_unsafe_level(report, steps, skip=i + 1) is None
+        ):
             return True
 
     return False
 
 
+def part_one(reports: list[Report] | PackedReports) -> int:
+    if isinstance(reports, PackedReports):
+        return int((reports.safe(INCREASING) | reports.safe(DECREASING)).sum())
+    safe_reports = list(filter(is_report_safe, reports))
+    return len(safe_reports)
+
+
+def part_two(reports: list[Report] | PackedReports) -> int:
+    if isinstance(reports, PackedReports):
+        safe = reports.safe_with_problem_dampener(INCREASING) | reports.safe_with_problem_dampener(DECREASING)
+        return int(safe.sum())
+    safe_reports_with_problem_dampener = list(filter(is_report_safe_with_problem_dampener, reports))
+    return len(safe_reports_with_problem_dampener)
+
+
+def solve_stream(lines: Iterable[bytes]) -> tuple[int, int]:
+    # every report is checked on its own, so only one of them is kept in memory at a time
+    safe_reports = 0
+    safe_reports_with_problem_dampener = 0
+    for line in lines:
+        report = list(map(int, line.split()))
+        safe_reports += is_report_safe(report)
+        safe_reports_with_problem_dampener += is_report_safe_with_problem_dampener(report)
+    return safe_reports, safe_reports_with_problem_dampener
+
+
+def count_safe_reports(buffer: bytes | memoryview) -> tuple[int, int]:
+    """
+    Counts the safe reports without and with the problem dampener in a part of an input.
+    """
+
+    if import_numpy() is not None:
+        packed = PackedReports.from_buffer(buffer)
+        return part_one(packed), part_two(packed)
+    return solve_stream(bytes(buffer).splitlines())
+
+
+def solve_parallel(input: PuzzleInput, jobs: int) -> tuple[int, int]:
+    """
+    Solves both parts by counting the safe reports in chunks of the input in `jobs` worker processes.
+
+    The workers only return the counts of their chunk, so the reports are never collected in the parent process.
+    """
+
+    counts = map_chunks(count_safe_reports, input, jobs)
+    return sum(safe for safe, _ in counts), sum(safe_with_problem_dampener for _, safe_with_problem_dampener in counts)
+
+
 def main():
-    print_day(2, "Red-Nosed Reports")
+    print_day(2, TITLE)
+
+    reports = parse(get_input(2))
 
     # Part One: Count the number of safe reports
 
-    safe_reports = list(filter(is_report_safe, reports))
-    print(f"Number of safe reports: {len(safe_reports)}")
+    print(f"Number of safe reports: {part_one(reports)}")
 
     # Part Two: Problem Dampener
 
-    safe_reports_with_problem_dampener = list(
-        filter(is_report_safe_with_problem_dampener, reports)
-    )
-    print(
-        f"Number of safe reports with problem dampener: {len(safe_reports_with_problem_dampener)}"
-    )
+    print(f"Number of safe reports with problem dampener: {part_two(reports)}")
 
 
 if __name__ == "__main__":
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import re
-from importlib.resources import files
+from typing import Iterable, NamedTuple
 
 from . import print_day
+from .parallel import map_chunks
+from .puzzle_input import PuzzleInput, get_input
+
+TITLE = "Mull It Over"
 
 
 def mul(a: int, b: int) -> int:
@@ -32,27 +36,126 @@ def find_enabled_uncorrupted_mul_instructions(corrupted_memory: str) -> list[str
     return enabled_instructions
 
 
+# the operands of a mul instruction are captured in groups 1 and 2, do() and don't() in groups 3 and 4
+INSTRUCTION = re.compile(r"mul\((\d+),(\d+)\)|(do)\(\)|(don't)\(\)")
+BYTES_INSTRUCTION = re.compile(INSTRUCTION.pattern.encode())
+
+# an instruction only contains an "m" or a "d" as its first character, so no instruction can span a position right
+# before one of them and the memory can be split there without changing which instructions are found
+CHUNK_BOUNDARY = re.compile(rb"[md]")
+
+
+class InstructionSums(NamedTuple):
+    """
+    The results of the mul instructions in a part of the memory.
+
+    Whether the first mul instructions are enabled depends on the instructions before the part, so their sum is kept
+    separate from the sum of the enabled instructions after the first do() or don't().
+    """
+
+    total: int
+    before_first_toggle: int
+    enabled_after_first_toggle: int
+    # whether the instructions after the part are enabled, or None if the part contains no do() or don't()
+    enabled: bool | None
+
+
+def scan_instructions(
+    corrupted_memory: str | bytes | memoryview, start: int = 0, end: int | None = None
+) -> InstructionSums:
+    """
+    Runs the uncorrupted instructions between `start` and `end` in a single pass over the memory.
+    """
+
+    pattern = INSTRUCTION if isinstance(corrupted_memory, str) else BYTES_INSTRUCTION
+    total = before_first_toggle = enabled_after_first_toggle = 0
+    enabled = None
+    for instruction in pattern.finditer(corrupted_memory, start, len(corrupted_memory) if end is None else end):
+        a, b, do, _ = instruction.groups()
+        if a is not None:
+            result = int(a) * int(b)
+            total += result
+            if enabled is None:
+                before_first_toggle += result
+            elif enabled:
+                enabled_after_first_toggle += result
+        else:
+            enabled = do is not None
+    return InstructionSums(total, before_first_toggle, enabled_after_first_toggle, enabled)
+
+
+def merge_instruction_sums(parts: Iterable[InstructionSums]) -> tuple[int, int]:
+    """
+    Combines the results of consecutive parts of the memory into the sum of all and of the enabled mul instructions.
+    """
+
+    total = enabled_total = 0
+    enabled = True
+    for part in parts:
+        total += part.total
+        enabled_total += part.enabled_after_first_toggle + (part.before_first_toggle if enabled else 0)
+        if part.enabled is not None:
+            enabled = part.enabled
+    return total, enabled_total
+
+
+def run_instructions(corrupted_memory: str) -> tuple[int, int]:
+    """
+    Runs the uncorrupted instructions in a single pass over the memory.
+
+    Returns the sum of the results of all mul instructions and the sum of the results of the enabled ones.
+    """
+
+    return merge_instruction_sums([scan_instructions(corrupted_memory)])
+
+
+def solve_parallel(input: PuzzleInput, jobs: int) -> tuple[int, int]:
+    """
+    Solves both parts by running the instructions in chunks of the input in `jobs` worker processes.
+
+    The workers can't know whether the instructions at the start of their chunk are enabled, so they return the sums
+    for both cases, which are merged in order with the state that the previous chunks end in.
+    """
+
+    return merge_instruction_sums(map_chunks(scan_instructions, input, jobs, CHUNK_BOUNDARY))
+
+
+def solve_stream(lines: Iterable[bytes]) -> tuple[int, int]:
+    """
+    Solves both parts by running the instructions line by line, carrying the enabled state over to the next line.
+
+    No instruction spans a line break, so only one line of the memory has to be held at a time.
+    """
+
+    return merge_instruction_sums(map(scan_instructions, lines))
+
+
+# both parts are answered by the same single pass, so the instructions are already run while parsing. The bytes
+# pattern runs directly over the mapped input, so the memory is neither decoded nor copied.
+def parse(input: PuzzleInput) -> tuple[int, int]:
+    return merge_instruction_sums([scan_instructions(input.buffer())])
+
+
+def part_one(results: tuple[int, int]) -> int:
+    return results[0]
+
+
+def part_two(results: tuple[int, int]) -> int:
+    return results[1]
+
+
 def main():
-    print_day(3, "Mull It Over")
+    print_day(3, TITLE)
 
-    with (files("solutions.inputs") / "03.txt").open() as file:
-        corrupted_memory = file.read()
+    results = parse(get_input(3))
 
     # Part One: Find uncorrupted mul instructions and add up their results
 
-    result = sum(
-        eval(instruction)
-        for instruction in find_uncorrupted_mul_instructions(corrupted_memory)
-    )
-    print(f"Sum of uncorrupted mul instructions: {result}")
+    print(f"Sum of uncorrupted mul instructions: {part_one(results)}")
 
     # Part Two: Find enabled uncorrupted mul instructions and add up their results
 
-    result = sum(
-        eval(instruction)
-        for instruction in find_enabled_uncorrupted_mul_instructions(corrupted_memory)
-    )
-    print(f"Sum of enabled uncorrupted mul instructions: {result}")
+    print(f"Sum of enabled uncorrupted mul instructions: {part_two(results)}")
 
 
 if __name__ == "__main__":
@@ -1,124 +1,323 @@
 from __future__ import annotations
 
-from importlib.resources import files
-from typing import Iterable, TypeAlias
+import re
+from collections import deque
+from typing import TYPE_CHECKING, Iterable, Iterator, Sequence, TypeAlias
 
-from . import print_day
+from . import import_numpy, print_day
+from .puzzle_input import PuzzleInput, get_input
 
+if TYPE_CHECKING:
+    import numpy as np
 
-def get_input() -> str:
-    with (files("solutions.inputs") / "04.txt").open() as file:
-        return file.read()
+TITLE = "Ceres Search"
 
 
-WordSearchLine: TypeAlias = list[str]
-WordSearch: TypeAlias = list[WordSearchLine]
+# a grid of letters, e.g. a tuple of rows of single characters
+Grid: TypeAlias = "Sequence[Sequence[str]]"
+# the word search as a 2-D array of the letters' bytes, if NumPy is installed
+WordSearchArray: TypeAlias = "np.ndarray"
 
+# the arrays are processed in bands of rows, so that the temporary masks of large grids fit in memory
+BAND_ROWS = 1024
+NEWLINE = re.compile(rb"\n")
 
-XMAS = "XMAS"
-XMAS_REVERSED = XMAS[::-1]
 
+def count_occurrences(text: str, word: str) -> int:
+    """
+    Counts the occurrences of the word in the text, including overlapping ones.
+    """
 
-def count_xmas_horizontal(word_search: WordSearch) -> int:
-    return sum(
-        (line := "".join(row)).count(XMAS) + line.count(XMAS_REVERSED)
-        for row in word_search
-    )
+    if not any(word[:k] == word[-k:] for k in range(1, len(word))):
+        # the occurrences of a word that can't overlap itself are counted natively
+        return text.count(word)
+    count = 0
+    start = text.find(word)
+    while start != -1:
+        count += 1
+        start = text.find(word, start + 1)
+    return count
 
 
-def count_xmas_vertical(word_search: WordSearch) -> int:
-    return sum(
-        (col := "".join(column)).count(XMAS) + col.count(XMAS_REVERSED)
-        for column in zip(*word_search)
-    )
+def count_both_ways(lines: str, word: str) -> int:
+    return count_occurrences(lines, word) + count_occurrences(lines, word[::-1])
 
 
-def count_xmas_diagonal(word_search: WordSearch) -> int:
-    def get_diagonal(i: int, j: int) -> str:
-        return "".join(
-            word_search[i + k][j + k]
-            for k in range(len(XMAS))
-            if 0 <= i + k < len(word_search) and 0 <= j + k < len(word_search[i])
-        )
+class WordSearch:
+    """
+    A word search with all lines a word can be written along, i.e. its rows, columns and both families of diagonals.
 
-    return sum(
-        (diagonal := get_diagonal(i, j)).count(XMAS) + diagonal.count(XMAS_REVERSED)
-        for i in range(len(word_search))
-        for j in range(len(word_search[i]))
-    )
+    Each family of lines is joined into a single string, separated by newlines, so that counting a word in one
+    direction is a single `str.count` over the string.
+    """
 
+    rows: tuple[str, ...]
+    columns: str
+    # the diagonals from the top left to the bottom right
+    diagonals: str
+    # the diagonals from the top right to the bottom left
+    anti_diagonals: str
 
-def count_xmas_diagonal_reverse(word_search: WordSearch) -> int:
-    def get_reverse_diagonal(i: int, j: int) -> str:
-        return "".join(
-            word_search[i + k][j - k]
-            for k in range(len(XMAS))
-            if 0 <= i + k < len(word_search) and 0 <= j - k < len(word_search[i])
+    def __init__(self, rows: Iterable[Iterable[str]]) -> None:
+        self.rows = tuple(row if isinstance(row, str) else "".join(row) for row in rows)
+        height = len(self.rows)
+        self.columns = "\n".join(map("".join, zip(*self.rows)))
+        # shifting every row one further than the previous one turns the diagonals into columns, the newlines that
+        # fill up the shifted rows end up between the diagonals
+        self.diagonals = "\n".join(
+            map("".join, zip(*("\n" * (height - 1 - i) + row + "\n" * i for i, row in enumerate(self.rows))))
+        )
+        self.anti_diagonals = "\n".join(
+            map("".join, zip(*("\n" * i + row + "\n" * (height - 1 - i) for i, row in enumerate(self.rows))))
         )
 
-    return sum(
-        (diagonal := get_reverse_diagonal(i, j)).count(XMAS)
-        + diagonal.count(XMAS_REVERSED)
-        for i in range(len(word_search))
-        for j in range(len(word_search[i]))
-    )
+    @staticmethod
+    def from_grid(grid: WordSearch | Grid | WordSearchArray) -> WordSearch:
+        if isinstance(grid, WordSearch):
+            return grid
+        if not isinstance(grid, (list, tuple)):
+            return WordSearch(row.tobytes().decode() for row in grid)
+        return WordSearch(grid)
 
+    @property
+    def families(self) -> tuple[str, str, str, str]:
+        return "\n".join(self.rows), self.columns, self.diagonals, self.anti_diagonals
 
-def count_xmas(word_search: WordSearch) -> int:
-    return (
-        count_xmas_horizontal(word_search)
-        + count_xmas_vertical(word_search)
-        + count_xmas_diagonal(word_search)
-        + count_xmas_diagonal_reverse(word_search)
-    )
+    def count(self, word: str) -> int:
+        """
+        Counts how often the word appears in any of the 8 directions.
+        """
 
+        return sum(count_both_ways(family, word) for family in self.families)
 
-MAS = "MAS"
-MAS_REVERSED = MAS[::-1]
 
+XMAS = "XMAS"
 
-def count_x_mas(word_search: WordSearch) -> int:
-    # for every cell in the grid
-    # get the first diagonal using the top left and bottom right corners
-    # get the second diagonal using the top right and bottom left corners
-    # check if both diagonals contain 'MAS' or 'SAM'
 
-    def get_diagonal_top_left_bottom_right(i: int, j: int) -> str:
-        return "".join(
-            word_search[i + k][j + k]
-            for k in range(-1, len(MAS) - 1)
-            if 0 <= i + k < len(word_search) and 0 <= j + k < len(word_search[i])
-        )
+def count_xmas_horizontal(word_search: WordSearch | Grid) -> int:
+    return count_both_ways(WordSearch.from_grid(word_search).families[0], XMAS)
+
+
+def count_xmas_vertical(word_search: WordSearch | Grid) -> int:
+    return count_both_ways(WordSearch.from_grid(word_search).columns, XMAS)
+
+
+def count_xmas_diagonal(word_search: WordSearch | Grid) -> int:
+    return count_both_ways(WordSearch.from_grid(word_search).diagonals, XMAS)
+
+
+def count_xmas_diagonal_reverse(word_search: WordSearch | Grid) -> int:
+    return count_both_ways(WordSearch.from_grid(word_search).anti_diagonals, XMAS)
+
 
-    def get_diagonal_top_right_bottom_left(i: int, j: int) -> str:
-        return "".join(
-            word_search[i + k][j - k]
-            for k in range(-1, len(MAS) - 1)
-            if 0 <= i + k < len(word_search) and 0 <= j - k < len(word_search[i])
+def count_xmas(word_search: WordSearch | Grid) -> int:
+    return WordSearch.from_grid(word_search).count(XMAS)
+
+
+MAS = "MAS"
+
+
+def count_x_mas(word_search: WordSearch | Grid) -> int:
+    """
+    Counts the X-MASes, i.e. the "A"s with "MAS" or "SAM" along both diagonals through them.
+    """
+
+    rows = WordSearch.from_grid(word_search).rows
+    ends = (MAS[0] + MAS[-1], MAS[-1] + MAS[0])
+    count = 0
+    for above, row, below in zip(rows, rows[1:], rows[2:]):
+        center = row.find(MAS[1], 1, len(row) - 1)
+        while center != -1:
+            count += (
+                above[center - 1] + below[center + 1] in ends and above[center + 1] + below[center - 1] in ends
+            )
+            center = row.find(MAS[1], center + 1, len(row) - 1)
+    return count
+
+
+class WordAutomaton:
+    """
+    An Aho-Corasick automaton that finds all occurrences of many words in a single pass over a text.
+
+    The automaton is a trie of the words, where every state also has a transition for every letter that doesn't
+    continue its prefix: to the state of the longest suffix of the prefix plus the letter that is in the trie.
+    """
+
+    words: list[str]
+    __transitions: list[dict[str, int]]
+    # the indices of the words that end in each state, without the ones ending in its suffix states
+    __ends: list[list[int]]
+    # the state of the longest proper suffix of each state's prefix, in breadth-first order of the states
+    __suffixes: list[tuple[int, int]]
+
+    def __init__(self, words: Iterable[str]) -> None:
+        self.words = list(words)
+        self.__transitions = [{}]
+        self.__ends = [[]]
+        for index, word in enumerate(self.words):
+            state = 0
+            for letter in word:
+                if letter not in self.__transitions[state]:
+                    self.__transitions.append({})
+                    self.__ends.append([])
+                    self.__transitions[state][letter] = len(self.__transitions) - 1
+                state = self.__transitions[state][letter]
+            self.__ends[state].append(index)
+
+        # the states are completed in breadth-first order, so the transitions of their suffix states are complete
+        self.__suffixes = []
+        queue = deque((child, 0) for child in self.__transitions[0].values())
+        while queue:
+            state, suffix = queue.popleft()
+            self.__suffixes.append((state, suffix))
+            trie_children = self.__transitions[state]
+            for letter, child in trie_children.items():
+                queue.append((child, self.__transitions[suffix].get(letter, 0)))
+            self.__transitions[state] = {**self.__transitions[suffix], **trie_children}
+
+    def count(self, lines: Iterable[str]) -> list[int]:
+        """
+        Counts the occurrences of every word in the lines, which are searched separately.
+        """
+
+        transitions = self.__transitions
+        visits = [0] * len(transitions)
+        for line in lines:
+            state = 0
+            for letter in line:
+                state = transitions[state].get(letter, 0)
+                visits[state] += 1
+
+        # a word also ends wherever a state is visited that the word's state is a suffix of
+        for state, suffix in reversed(self.__suffixes):
+            visits[suffix] += visits[state]
+        counts = [0] * len(self.words)
+        for state, ends in enumerate(self.__ends):
+            for index in ends:
+                counts[index] += visits[state]
+        return counts
+
+
+def count_words(word_search: WordSearch | Grid | WordSearchArray, words: Iterable[str]) -> dict[str, int]:
+    """
+    Counts how often each word appears in the word search in any of the 8 directions.
+
+    All words and their reversals are searched in one pass over the line families of the word search, so the time
+    hardly depends on the number of words.
+    """
+
+    words = list(dict.fromkeys(words))
+    automaton = WordAutomaton(words + [word[::-1] for word in words])
+    # the newlines between the lines of a family aren't part of any word, so the lines are still searched separately
+    counts = automaton.count(WordSearch.from_grid(word_search).families)
+    return {word: count + reversed_count for word, count, reversed_count in zip(words, counts, counts[len(words) :])}
+
+
+def row_bands(word_search: WordSearchArray, overlap: int) -> Iterator[WordSearchArray]:
+    """
+    Splits the word search into bands of `BAND_ROWS` rows, each followed by `overlap` rows of the next band.
+    """
+
+    for start in range(0, len(word_search), BAND_ROWS):
+        yield word_search[start : start + BAND_ROWS + overlap]
+
+
+def count_word_array(word_search: WordSearchArray, word: str) -> int:
+    """
+    Counts how often the word appears in the word search in any of the 8 directions.
+
+    For every direction, the grid is compared to each letter of the word, shifted by the letter's offset in that
+    direction, and the positions where all letters match are counted. Reading a word backwards is the same as reading
+    it reversed forwards, so only the directions that go to the right or down are needed.
+    """
+
+    span = len(word) - 1
+    count = 0
+    for band in row_bands(word_search, span):
+        height, width = band.shape
+        for dy, dx in ((0, 1), (1, 0), (1, 1), (1, -1)):
+            # the words starting in the band, but not in the rows that overlap with the next band
+            rows = min(BAND_ROWS, height - dy * span)
+            columns = width - abs(dx) * span
+            if rows <= 0 or columns <= 0:
+                continue
+            left = span if dx < 0 else 0
+            for letters in (word, word[::-1]):
+                matches = None
+                for k, letter in enumerate(letters.encode()):
+                    shifted = band[dy * k : dy * k + rows, left + dx * k : left + dx * k + columns] == letter
+                    matches = shifted if matches is None else matches & shifted
+                count += int(matches.sum())
+    return count
+
+
+def count_x_mas_array(word_search: WordSearchArray) -> int:
+    """
+    Counts the X-MASes in the word search by comparing the 3x3 windows around every "A" at once.
+    """
+
+    m, a, s = MAS.encode()
+    count = 0
+    for band in row_bands(word_search, 2):
+        # the corners of the window around every cell that isn't on the edge of the band
+        top_left, top_right = band[:-2, :-2], band[:-2, 2:]
+        bottom_left, bottom_right = band[2:, :-2], band[2:, 2:]
+        x_mas = (
+            (band[1:-1, 1:-1] == a)
+            & (((top_left == m) & (bottom_right == s)) | ((top_left == s) & (bottom_right == m)))
+            & (((top_right == m) & (bottom_left == s)) | ((top_right == s) & (bottom_left == m)))
         )
+        # the windows centered on the last rows of the band are also counted in the next band
+        count += int(x_mas[:BAND_ROWS].sum())
+    return count
+
+
+def parse(input: PuzzleInput) -> WordSearch | WordSearchArray:
+    if import_numpy() is not None:
+        return parse_array(input.buffer())
+    return WordSearch(input.text().splitlines())
 
-    return sum(
-        (get_diagonal_top_left_bottom_right(i, j) in (MAS, MAS_REVERSED))
-        and (get_diagonal_top_right_bottom_left(i, j) in (MAS, MAS_REVERSED))
-        for i in range(len(word_search))
-        for j in range(len(word_search[i]))
-    )
+
+def parse_array(buffer: memoryview) -> WordSearchArray:
+    np = import_numpy()
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    if not len(data):
+        return np.zeros((0, 0), dtype=np.uint8)
+    if data[-1] != ord("\n"):
+        data = np.append(data, np.uint8(ord("\n")))
+    newline = NEWLINE.search(buffer)
+    width = newline.start() if newline is not None else len(data) - 1
+    if len(data) % (width + 1):
+        raise ValueError("all lines of the word search must have the same length")
+    # every row is followed by its newline, which is cut off again without copying the grid
+    return data.reshape(-1, width + 1)[:, :width]
+
+
+def part_one(word_search: WordSearch | WordSearchArray) -> int:
+    if not isinstance(word_search, WordSearch):
+        return count_word_array(word_search, XMAS)
+    return word_search.count(XMAS)
+
+
+def part_two(word_search: WordSearch | WordSearchArray) -> int:
+    if not isinstance(word_search, WordSearch):
+        return count_x_mas_array(word_search)
+    return count_x_mas(word_search)
 
 
 def main():
-    print_day(4, "Ceres Search")
+    print_day(4, TITLE)
+
+    word_search = parse(get_input(4))
 
     # Part One: Count the number of times XMAS appears
 
-    word_search = tuple(tuple(line) for line in get_input().splitlines())
-    num_xmas = count_xmas(word_search)
-    print(f"Number of times XMAS appears: {num_xmas}")
+    print(f"Number of times XMAS appears: {part_one(word_search)}")
 
     # Part Two: Count the number of times an X-MAS appears
     # an X-MAS is an X shape made out of two diagonal 'MAS'es where each MAS might be written forwards or backwards
 
-    num_x_mas = count_x_mas(word_search)
-    print(f"Number of times X-MAS appears: {num_x_mas}")
+    print(f"Number of times X-MAS appears: {part_two(word_search)}")
 
 
 if __name__ == "__main__":
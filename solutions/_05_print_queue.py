@@ -1,14 +1,11 @@
 from __future__ import annotations
 
-from importlib.resources import files
 from typing import TypeAlias
 
 from . import print_day
+from .puzzle_input import PuzzleInput, get_input
 
-
-def get_input():
-    with (files("solutions.inputs") / "05.txt").open() as file:
-        return file.read()
+TITLE = "Print Queue"
 
 
 Rule: TypeAlias = tuple[int, int]
@@ -180,30 +177,35 @@ def fix_incorrectly_ordered_updates(
     return tuple(fixed_updates)
 
 
+def parse(input: PuzzleInput) -> tuple[DirectedGraph, Updates]:
+    rules, updates = parse_input(input.text())
+    return make_rule_graph(rules), updates
+
+
+def part_one(rule_graph_and_updates: tuple[DirectedGraph, Updates]) -> int:
+    rule_graph, updates = rule_graph_and_updates
+    return get_middle_page_numbers(find_correctly_ordered_updates(rule_graph, updates))
+
+
+def part_two(rule_graph_and_updates: tuple[DirectedGraph, Updates]) -> int:
+    rule_graph, updates = rule_graph_and_updates
+    return get_middle_page_numbers(
+        fix_incorrectly_ordered_updates(rule_graph, find_incorrectly_ordered_updates(rule_graph, updates))
+    )
+
+
 def main():
-    print_day(5, "Print Queue")
+    print_day(5, TITLE)
+
+    rule_graph_and_updates = parse(get_input(5))
 
     # Part One: Find correctly ordered updates and calculate the sum of the middle page numbers
 
-    rules, updates = parse_input(get_input())
-    rule_graph = make_rule_graph(rules)
-    sum_middle_page_numbers_correct = get_middle_page_numbers(
-        find_correctly_ordered_updates(rule_graph, updates)
-    )
-    print(
-        f"Sum of middle page numbers of correctly ordered updates: {sum_middle_page_numbers_correct}"
-    )
+    print(f"Sum of middle page numbers of correctly ordered updates: {part_one(rule_graph_and_updates)}")
 
     # Part Two: Find and fix the incorrectly ordered updates and calculate the sum of the middle page numbers
 
-    sum_middle_page_numbers_fixed = get_middle_page_numbers(
-        fix_incorrectly_ordered_updates(
-            rule_graph, find_incorrectly_ordered_updates(rule_graph, updates)
-        )
-    )
-    print(
-        f"Sum of middle page numbers of fixed incorrectly ordered updates: {sum_middle_page_numbers_fixed}"
-    )
+    print(f"Sum of middle page numbers of fixed incorrectly ordered updates: {part_two(rule_graph_and_updates)}")
 
 
 if __name__ == "__main__":
@@ -2,15 +2,12 @@ from __future__ import annotations
 
 from copy import deepcopy
 from enum import StrEnum
-from importlib.resources import files
 from typing import TypeAlias
 
 from . import print_day
+from .puzzle_input import PuzzleInput, get_input
 
-
-def get_input() -> str:
-    with (files("solutions.inputs") / "06.txt").open() as file:
-        return file.read()
+TITLE = "Guard Gallivant"
 
 
 Coordinate: TypeAlias = tuple[int, int]
@@ -190,7 +187,6 @@ class Map:
         return sum(point.has_been_visited() for row in self.points for point in row)
 
     def find_possible_obstructions(self) -> None:
-        print("Finding possible obstructions (this may take a while)...")
         guard = self.find_guard()
         starting_guard = deepcopy(guard)
         for row in self.points:
@@ -235,20 +231,36 @@ class Map:
         )
 
 
+def parse(input: PuzzleInput) -> Map:
+    return Map(input.text())
+
+
+def part_one(map: Map) -> int:
+    # predicting the guard's movements marks the visited points, so work on a copy to keep the parsed map intact
+    m = deepcopy(map)
+    m.predict_guard_movements()
+    return m.count_visited()
+
+
+def part_two(map: Map) -> int:
+    m = deepcopy(map)
+    m.find_possible_obstructions()
+    return m.count_possible_obstructions()
+
+
 def main():
-    print_day(6, "Guard Gallivant")
+    print_day(6, TITLE)
+
+    map = parse(get_input(6))
 
     # Part One: Predict the path of the Guard - how many distinct positions will the guard visit before leaving the mapped area?
 
-    m = Map(get_input())
-    m.predict_guard_movements()
-    print(f"Guard visited {m.count_visited()} distinct positions")
+    print(f"Guard visited {part_one(map)} distinct positions")
 
     # Part Two: Find all possible obstructions that would get the guard stuck in a loop
 
-    m = Map(get_input())
-    m.find_possible_obstructions()
-    print(f"Found {m.count_possible_obstructions()} possible obstructions")
+    print("Finding possible obstructions (this may take a while)...")
+    print(f"Found {part_two(map)} possible obstructions")
 
 
 if __name__ == "__main__":
@@ -2,15 +2,13 @@ from __future__ import annotations
 
 from enum import StrEnum
 from functools import reduce
-from importlib.resources import files
 from itertools import product
+from typing import Iterable, Iterator
 
 from . import print_day
+from .puzzle_input import PuzzleInput, get_input
 
-
-def get_input() -> str:
-    with (files("solutions.inputs") / "07.txt").open() as file:
-        return file.read()
+TITLE = "Bridge Repair"
 
 
 class Operator(StrEnum):
@@ -46,17 +44,23 @@ class Equation:
         result, terms = s.split(": ")
         return Equation(int(result), list(map(int, terms.split())))
 
-    def find_possible_operators(self, *, with_concat: bool = False) -> None:
+    def possible_operators(self, *, with_concat: bool = False) -> Iterator[list[Operator]]:
+        """
+        Yields every combination of operators that makes the equation true, without storing them in `operators`.
+        """
+
         operators = list(Operator)
         if not with_concat:
             operators.remove(Operator.CONCAT)
-        possible_operator_combinations = list(
-            product(operators, repeat=len(self.operands) - 1)
-        )
-        # print(f" permutations for {self} -> {possible_operator_combinations}")
-        for operators in possible_operator_combinations:
-            if self.evaluate(operators) == self.result:
-                self.operators.append(list(operators))
+        for combination in product(operators, repeat=len(self.operands) - 1):
+            if self.evaluate(combination) == self.result:
+                yield list(combination)
+
+    def could_be_true(self, *, with_concat: bool = False) -> bool:
+        return next(self.possible_operators(with_concat=with_concat), None) is not None
+
+    def find_possible_operators(self, *, with_concat: bool = False) -> None:
+        self.operators.extend(self.possible_operators(with_concat=with_concat))
 
     def evaluate(self, operators: list[Operator]) -> int:
         # print(f"evaluating {self.operands} with {operators}")
@@ -96,34 +100,47 @@ def parse_input(input: str) -> list[Equation]:
     return [Equation.from_str(line) for line in input.splitlines()]
 
 
+def parse(input: PuzzleInput) -> list[Equation]:
+    return parse_input(input.text())
+
+
+# the parsed equations are shared between both parts, so the parts only check them instead of storing the operators
+def part_one(equations: list[Equation]) -> int:
+    return sum(eq.result for eq in equations if eq.could_be_true())
+
+
+def part_two(equations: list[Equation]) -> int:
+    return sum(eq.result for eq in equations if eq.could_be_true(with_concat=True))
+
+
+def solve_stream(lines: Iterable[bytes]) -> tuple[int, int]:
+    # every equation is solved on its own, so only one of them is kept in memory at a time
+    calibration_result = 0
+    calibration_result_with_concat = 0
+    for line in lines:
+        eq = Equation.from_str(line.decode())
+        if eq.could_be_true():
+            # every solution without the concat operator is also a solution with it
+            calibration_result += eq.result
+            calibration_result_with_concat += eq.result
+        elif eq.could_be_true(with_concat=True):
+            calibration_result_with_concat += eq.result
+    return calibration_result, calibration_result_with_concat
+
+
 def main():
-    print_day(7, "Bridge Repair")
+    print_day(7, TITLE)
+
+    equations = parse(get_input(7))
 
     # Part One: Find the total calibration result of the equations that could possibly be true
 
-    equations = parse_input(get_input())
-    for eq in equations:
-        eq.find_possible_operators()
-    equations_with_possible_solutions = [
-        eq for eq in equations if eq.has_possible_solutions()
-    ]
-    sum_of_possible_solutions = sum(
-        eq.result for eq in equations_with_possible_solutions
-    )
-    print(f"Total calibration result: {sum_of_possible_solutions}")
+    print(f"Total calibration result: {part_one(equations)}")
 
     # Part Two: Find the total calibration result of the equations that could possibly be true with the concat operator
     print("Trying with the concat operator (this may take a while)...")
-    for eq in equations:
-        eq.operators = []
-        eq.find_possible_operators(with_concat=True)
-    equations_with_possible_solutions = [
-        eq for eq in equations if eq.has_possible_solutions()
-    ]
-    sum_of_possible_solutions = sum(
-        eq.result for eq in equations_with_possible_solutions
-    )
-    print(f"Total calibration result with concat operator: {sum_of_possible_solutions}")
+    print(f"Total calibration result with concat operator: {part_two(equations)}")
+
 
 if __name__ == "__main__":
     main()
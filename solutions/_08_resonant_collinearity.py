@@ -1,15 +1,13 @@
 from __future__ import annotations
 
-from importlib.resources import files
+from copy import deepcopy
 from operator import add, sub
 from typing import NamedTuple
 
 from . import print_day
+from .puzzle_input import PuzzleInput, get_input
 
-
-def get_input() -> str:
-    with (files("solutions.inputs") / "08.txt").open() as file:
-        return file.read()
+TITLE = "Resonant Collinearity"
 
 
 class Coordinate(NamedTuple):
@@ -122,18 +120,33 @@ class Map:
         return sum(point.has_antinode for row in self.points for point in row)
 
 
+def parse(input: PuzzleInput) -> Map:
+    return Map(input.text())
+
+
+def part_one(map: Map) -> int:
+    # finding the antinodes marks the points, so work on a copy to keep the parsed map intact
+    m = deepcopy(map)
+    m.find_antinodes()
+    return m.count_antinodes()
+
+
+def part_two(map: Map) -> int:
+    m = deepcopy(map)
+    m.find_antinodes_with_resonant_harmonics()
+    return m.count_antinodes()
+
+
 def main():
-    print_day(8, "Resonant Collinearity")
+    print_day(8, TITLE)
+
+    map = parse(get_input(8))
 
     # Part One: Find the number of unique locations that contain an antinode
-    map = Map(get_input())
-    map.find_antinodes()
-    print(f"Number of unique locations with antinodes: {map.count_antinodes()}")
+    print(f"Number of unique locations with antinodes: {part_one(map)}")
 
     # Part Two: Find the number of antinodes taking effects of resonant harmonics into account
-    map = Map(get_input())
-    map.find_antinodes_with_resonant_harmonics()
-    print(f"Number of antinodes with resonant harmonics: {map.count_antinodes()}")
+    print(f"Number of antinodes with resonant harmonics: {part_two(map)}")
 
 
 if __name__ == "__main__":
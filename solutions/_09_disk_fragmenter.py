@@ -1,13 +1,11 @@
 from __future__ import annotations
 
-from importlib.resources import files
+from copy import deepcopy
 
 from . import print_day
+from .puzzle_input import PuzzleInput, get_input
 
-
-def get_input() -> str:
-    with (files("solutions.inputs") / "09.txt").open() as file:
-        return file.read().strip()
+TITLE = "Disk Fragmenter"
 
 
 class Region:
@@ -88,7 +86,6 @@ class Disk:
         return " ".join(str(region) for region in self.regions)
 
     def defragment_blocks(self) -> None:
-        print("Defragmenting disk by blocks (this may take a while)...")
         for i in range(len(self.blocks) - 1, -1, -1):
             if self.blocks[i] is not None:
                 for j in range(i):
@@ -100,8 +97,6 @@ class Disk:
                         break
 
     def defragment_files(self) -> None:
-        print("Defragmenting disk by files (this may take a while)...")
-
         files = [region for region in self.regions if isinstance(region, File)]
 
         for file in files[::-1]:
@@ -147,19 +142,36 @@ class Disk:
         for region in self.regions:
             self.blocks.extend([region.file_id if isinstance(region, File) else None] * region.length)
 
+
+def parse(input: PuzzleInput) -> Disk:
+    return Disk(input.text().strip())
+
+
+def part_one(disk: Disk) -> int:
+    # defragmenting moves the blocks around, so work on a copy to keep the parsed disk intact
+    d = deepcopy(disk)
+    d.defragment_blocks()
+    return d.calculate_block_checksum()
+
+
+def part_two(disk: Disk) -> int:
+    d = deepcopy(disk)
+    d.defragment_files()
+    return d.calculate_file_checksum()
+
+
 def main():
-    print_day(9, "Disk Fragmenter")
+    print_day(9, TITLE)
+
+    disk = parse(get_input(9))
 
     # Part One: Defragment the disk blockwise and calculate the checksum
-    disk = Disk(get_input())
-    disk.defragment_blocks()
-    print(f"Checksum of blockwise-defragmented disk: {disk.calculate_block_checksum()}")
+    print("Defragmenting disk by blocks (this may take a while)...")
+    print(f"Checksum of blockwise-defragmented disk: {part_one(disk)}")
 
     # Part Two: Defragment the disk by files and calculate the checksum
-    disk = Disk(get_input())
-    disk.defragment_files()
-    disk.blocks_from_regions()
-    print(f"Checksum of filewise-defragmented disk: {disk.calculate_file_checksum()} {disk.calculate_block_checksum()}")
+    print("Defragmenting disk by files (this may take a while)...")
+    print(f"Checksum of filewise-defragmented disk: {part_two(disk)}")
 
 
 if __name__ == "__main__":
@@ -1,14 +1,11 @@
 from __future__ import annotations
 
-from importlib.resources import files
 from typing import NamedTuple
 
 from . import print_day
+from .puzzle_input import PuzzleInput, get_input
 
-
-def get_input() -> str:
-    with (files("solutions.inputs") / "10.txt").open() as file:
-        return file.read()
+TITLE = "Hoof It"
 
 
 class Coordinate(NamedTuple):
@@ -106,15 +103,29 @@ class TopographicMap:
     def sum_of_trailhead_ratings(self) -> int:
         return sum(point.rating for row in self.points for point in row if point.is_trailhead)
 
+
+def parse(input: PuzzleInput) -> TopographicMap:
+    return TopographicMap(input.text())
+
+
+def part_one(map: TopographicMap) -> int:
+    return map.sum_of_trailhead_scores()
+
+
+def part_two(map: TopographicMap) -> int:
+    return map.sum_of_trailhead_ratings()
+
+
 def main():
-    print_day(10, "Hoof It")
+    print_day(10, TITLE)
+
+    map = parse(get_input(10))
 
     # Part One: Find the sum of the scores of all trailheads on the topographic map.
-    map = TopographicMap(get_input())
-    print(f"Sum of trailhead scores: {map.sum_of_trailhead_scores()}")
+    print(f"Sum of trailhead scores: {part_one(map)}")
 
     # Part Two: Find the sum of the ratings of all trailheads on the topographic map.
-    print(f"Sum of trailhead ratings: {map.sum_of_trailhead_ratings()}")
+    print(f"Sum of trailhead ratings: {part_two(map)}")
 
 
 if __name__ == "__main__":
@@ -1,15 +1,11 @@
 from __future__ import annotations
 
-from importlib.resources import files
-from time import perf_counter_ns
-from typing import TypeAlias
+from typing import Iterable, TypeAlias
 
 from . import print_day
+from .puzzle_input import PuzzleInput, get_input
 
-
-def get_input() -> str:
-    with (files("solutions.inputs") / "11.txt").open() as file:
-        return file.read()
+TITLE = "Plutonian Pebbles"
 
 
 class Stone:
@@ -40,14 +36,13 @@ class Stone:
 class Stones:
     stones: list[Stone]
 
-    def __init__(self, input: str):
-        self.stones = [Stone(int(number)) for number in input.split()]
+    def __init__(self, input: str | Iterable[int]):
+        numbers = input.split() if isinstance(input, str) else input
+        self.stones = [Stone(int(number)) for number in numbers]
 
     def mutate(self, number_of_times: int = 1) -> None:
-        for i in range(number_of_times):
-            start = perf_counter_ns()
+        for _ in range(number_of_times):
             self.stones = [s for stone in self.stones for s in stone.mutate()]
-            print(f"Mutation {i + 1} took {(perf_counter_ns() - start) / 1_000_000:.3f}ms")
 
     def __str__(self):
         return " ".join(str(stone) for stone in self.stones)
@@ -65,12 +60,12 @@ StoneV2: TypeAlias = int
 class StonesV2:
     stones: dict[StoneV2, int]
 
-    def __init__(self, input: str):
-        self.stones = {StoneV2(number): 1 for number in input.split()}
+    def __init__(self, input: str | Iterable[int]):
+        numbers = input.split() if isinstance(input, str) else input
+        self.stones = {StoneV2(number): 1 for number in numbers}
 
     def mutate(self, number_of_times: int = 1) -> None:
-        for i in range(number_of_times):
-            start = perf_counter_ns()
+        for _ in range(number_of_times):
             new_stones = {}
             for stone, count in self.stones.items():
                 if stone == 0:
@@ -92,7 +87,6 @@ class StonesV2:
                     # )
 
             self.stones = new_stones
-            print(f"Mutation {i + 1} took {(perf_counter_ns() - start) / 1_000_000:.3f}ms")
 
     def __str__(self):
         return str(sorted(self.stones.items()))
@@ -101,20 +95,32 @@ class StonesV2:
         return sum(self.stones.values())
 
 
-def main():
-    print_day(11, "Plutonian Pebbles")
+def parse(input: PuzzleInput) -> list[int]:
+    return list(map(int, input.text().split()))
 
-    # Part One: How many stones are there after blinking 25 times?
-    stones = Stones(get_input())
+
+def part_one(numbers: list[int]) -> int:
+    stones = Stones(numbers)
     stones.mutate(25)
-    print(f"Stones after blinking 25 times: {len(stones)}")
+    return len(stones)
 
-    # Part Two: How many stones are there after blinking 75 times?
-    stones = StonesV2(get_input())
+
+def part_two(numbers: list[int]) -> int:
+    stones = StonesV2(numbers)
     stones.mutate(75)
-    print(f"Stones after blinking 75 times: {len(stones)}")
+    return len(stones)
+
 
-    # Part Two:
+def main():
+    print_day(11, TITLE)
+
+    numbers = parse(get_input(11))
+
+    # Part One: How many stones are there after blinking 25 times?
+    print(f"Stones after blinking 25 times: {part_one(numbers)}")
+
+    # Part Two: How many stones are there after blinking 75 times?
+    print(f"Stones after blinking 75 times: {part_two(numbers)}")
 
 
 if __name__ == "__main__":
@@ -1,15 +1,12 @@
 from __future__ import annotations
 
 from functools import cache
-from importlib.resources import files
 from typing import ClassVar, NamedTuple, overload
 
 from . import print_day
+from .puzzle_input import PuzzleInput, get_input
 
-
-def get_input() -> str:
-    with (files("solutions.inputs") / "12.txt").open() as file:
-        return file.read()
+TITLE = "Garden Groups"
 
 
 class Coordinate(NamedTuple):
@@ -312,15 +309,28 @@ class Garden:
         return sum(region.discounted_fence_price for region in self.regions)
 
 
+def parse(input: PuzzleInput) -> Garden:
+    return Garden(input.text())
+
+
+def part_one(garden: Garden) -> int:
+    return garden.fence_price
+
+
+def part_two(garden: Garden) -> int:
+    return garden.discounted_fence_price
+
+
 def main():
-    print_day(12, "Garden Groups")
+    print_day(12, TITLE)
+
+    garden = parse(get_input(12))
 
     # Part One: Find the total price for fencing all regions
-    garden = Garden(get_input())
-    print(f"Fence price: {garden.fence_price}")
+    print(f"Fence price: {part_one(garden)}")
 
     # Part Two: Find the discounted price
-    print(f"Discounted fence price: {garden.discounted_fence_price}")
+    print(f"Discounted fence price: {part_two(garden)}")
 
 
 if __name__ == "__main__":
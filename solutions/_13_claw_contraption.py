@@ -1,15 +1,14 @@
 from __future__ import annotations
 
 import re
-from importlib.resources import files
-from typing import NamedTuple
+from itertools import chain
+from typing import Iterable, NamedTuple
 
 from . import print_day
+from .puzzle_input import PuzzleInput, get_input
 
+TITLE = "Claw Contraption"
 
-def get_input() -> str:
-    with (files("solutions.inputs") / "13.txt").open() as file:
-        return file.read()
 
 class Button:
     token_cost: int
@@ -75,44 +74,65 @@ class Machine:
         Cramer's rule, adapted from https://www.reddit.com/r/adventofcode/comments/1hd7irq/2024_day_13_an_explanation_of_the_mathematics
         """
 
-        self.prize += offset
+        # `+=` creates a new coordinate, so the machine itself stays unchanged and can be reused with other offsets
+        prize = self.prize
+        prize += offset
 
         # A = (p_x*b_y - prize_y*b_x) / (a_x*b_y - a_y*b_x)
         # B = (a_x*p_y - a_y*p_x) / (a_x*b_y - a_y*b_x)
         det = self.button_a.move_x * self.button_b.move_y - self.button_a.move_y * self.button_b.move_x
-        a = (self.prize.x * self.button_b.move_y - self.prize.y * self.button_b.move_x) / det
-        b = (self.button_a.move_x * self.prize.y - self.button_a.move_y * self.prize.x) / det
+        a = (prize.x * self.button_b.move_y - prize.y * self.button_b.move_x) / det
+        b = (self.button_a.move_x * prize.y - self.button_a.move_y * prize.x) / det
         # print(a, b)
         # print(
         # self.button_a.moved(a), self.button_b.moved(b), self.button_a.moved(a) + self.button_b.moved(b), self.prize
         # )
         # print(self.button_a.moved(a) + self.button_b.moved(b) == self.prize)
         # print("---")
-        if a.is_integer() and b.is_integer() and (self.button_a.moved(a) + self.button_b.moved(b)) == self.prize:
+        if a.is_integer() and b.is_integer() and (self.button_a.moved(a) + self.button_b.moved(b)) == prize:
             return int(self.button_a.token_cost * a + self.button_b.token_cost * b)
         return 0
 
 
+def parse(input: PuzzleInput) -> list[Machine]:
+    return [Machine(machine_input) for machine_input in input.text().split("\n\n")]
+
+
+def part_one(machines: list[Machine]) -> int:
+    return sum(machine.calculate_token_cost() for machine in machines)
+
+
+def part_two(machines: list[Machine]) -> int:
+    return sum(machine.calculate_token_cost(offset=10000000000000) for machine in machines)
+
+
+def solve_stream(lines: Iterable[bytes]) -> tuple[int, int]:
+    # every machine is solved on its own, so only the lines of one machine are kept in memory at a time
+    token_cost = 0
+    token_cost_with_offset = 0
+    machine_lines = []
+    # the empty line at the end finishes the last machine
+    for line in chain(lines, [b""]):
+        if line:
+            machine_lines.append(line.decode())
+        elif machine_lines:
+            machine = Machine("\n".join(machine_lines))
+            token_cost += machine.calculate_token_cost()
+            token_cost_with_offset += machine.calculate_token_cost(offset=10000000000000)
+            machine_lines = []
+    return token_cost, token_cost_with_offset
+
+
 def main():
-    print_day(13, "Claw Contraption")
+    print_day(13, TITLE)
+
+    machines = parse(get_input(13))
 
     # Part One: How many tokens to spend to win all possible prizes?
-    total_token_cost = 0
-    for machine_input in get_input().split("\n\n"):
-        machine = Machine(machine_input)
-        total_token_cost += machine.calculate_token_cost()
-        # print(total_token_cost)
-        # print("---")
-    print(f"Total token cost: {total_token_cost}")
+    print(f"Total token cost: {part_one(machines)}")
 
     # Part Two: Account for the offset of 10000000000000
-    total_token_cost = 0
-    for machine_input in get_input().split("\n\n"):
-        machine = Machine(machine_input)
-        total_token_cost += machine.calculate_token_cost(offset=10000000000000)
-        # print(total_token_cost)
-        # print("---")
-    print(f"Total token cost with offset: {total_token_cost}")
+    print(f"Total token cost with offset: {part_two(machines)}")
 
 
 if __name__ == "__main__":
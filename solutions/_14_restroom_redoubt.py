@@ -2,16 +2,13 @@ from __future__ import annotations
 
 import math
 import re
-import time
-from importlib.resources import files
-from typing import Literal, NamedTuple, TypeAlias
+from copy import deepcopy
+from typing import Iterable, Literal, NamedTuple, TypeAlias
 
 from . import print_day
+from .puzzle_input import PuzzleInput, get_input
 
-
-def get_input() -> str:
-    with (files("solutions.inputs") / "14.txt").open() as file:
-        return file.read()
+TITLE = "Restroom Redoubt"
 
 
 WIDTH = 101
@@ -131,20 +128,21 @@ def print_map(
         print(f"{i:>3} {' '.join(row)}")
 
 
-def main():
-    print_day(14, "Restroom Redoubt")
+def parse(input: PuzzleInput) -> list[Robot]:
+    return [Robot(line) for line in input.text().splitlines()]
 
-    # Part One: Find the safety factor after 100 seconds.
-    robots = [Robot(line) for line in get_input().splitlines()]
+
+def part_one(robots: list[Robot]) -> int:
+    # moving the robots changes their positions, so work on copies to keep the parsed robots intact
+    robots = deepcopy(robots)
     for r in robots:
         r.move(100)
-    safety_factor = calculate_safety_factor(robots)
-    print(f"The safety factor is {safety_factor}")
+    return calculate_safety_factor(robots)
 
-    # Part Two: Find the fewest number of seconds for the robots to display the "Christmas Tree Formation" Easter egg.
+
+def part_two(robots: list[Robot]) -> int:
     # Using the heuristic from https://www.reddit.com/r/adventofcode/comments/1he0g67/2024_day_14_part_2_the_clue_was_in_part_1/
-    robots = [Robot(line) for line in get_input().splitlines()]
-    print_map(robots, clear=False)
+    robots = deepcopy(robots)
     lowest_safety_factor = math.inf
     lowest_safety_factor_time = 0
     for i in range(1, 10_000):
@@ -154,10 +152,29 @@ def main():
         if (safety_factor := calculate_safety_factor(robots)) < lowest_safety_factor:
             lowest_safety_factor = safety_factor
             lowest_safety_factor_time = i
-            print_map(robots, clear=False)
-            print(f"New lowest safety factor: {lowest_safety_factor} at {lowest_safety_factor_time} seconds")
-            time.sleep(2)
-        # time.sleep(0.01)
+    return lowest_safety_factor_time
+
+
+def solve_stream(lines: Iterable[bytes]) -> tuple[int, int]:
+    # part two simulates all robots together, so they are kept in memory, but not the lines they were parsed from
+    robots = [Robot(line.decode()) for line in lines]
+    return part_one(robots), part_two(robots)
+
+
+def main():
+    print_day(14, TITLE)
+
+    robots = parse(get_input(14))
+
+    # Part One: Find the safety factor after 100 seconds.
+    print(f"The safety factor is {part_one(robots)}")
+
+    # Part Two: Find the fewest number of seconds for the robots to display the "Christmas Tree Formation" Easter egg.
+    lowest_safety_factor_time = part_two(robots)
+    christmas_tree = deepcopy(robots)
+    for r in christmas_tree:
+        r.move(lowest_safety_factor_time)
+    print_map(christmas_tree, clear=False, i=lowest_safety_factor_time)
     print(f"The Christmas Tree Formation probably appears after {lowest_safety_factor_time} seconds")
 
 
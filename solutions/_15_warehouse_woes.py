@@ -1,15 +1,13 @@
 from __future__ import annotations
 
+from copy import deepcopy
 from enum import StrEnum
-from importlib.resources import files
 from typing import NamedTuple, TypeAlias
 
 from . import print_day
+from .puzzle_input import PuzzleInput, get_input
 
-
-def get_input() -> str:
-    with (files("solutions.inputs") / "15.txt").open() as file:
-        return file.read()
+TITLE = "Warehouse Woes"
 
 
 class MoveType(StrEnum):
@@ -273,20 +271,35 @@ class Map:
         self.robot = next(tile for tile in self.tiles.values() if tile.type == TileType.ROBOT)
 
 
-def main():
-    print_day(15, "Warehouse Woes")
+def parse(input: PuzzleInput) -> Map:
+    map_input, moves = input.text().split("\n\n")
+    return Map(map_input, moves)
 
-    # Part One: Find the sum of the GPS coordinates of all boxes after all moves.
-    map_input, moves = get_input().split("\n\n")
-    m = Map(map_input, moves)
+
+def part_one(map: Map) -> int:
+    # moving the robot pushes the boxes around, so work on a copy to keep the parsed map intact
+    m = deepcopy(map)
     m.move_robot()
-    print(f"Sum of GPS coordinates of all boxes after all moves: {m.sum_of_boxes_gps_coordinates()}")
+    return m.sum_of_boxes_gps_coordinates()
 
-    # Part Two: Find the sum of the GPS coordinates of all boxes after all moves with a wide map.
-    m = Map(map_input, moves)
+
+def part_two(map: Map) -> int:
+    m = deepcopy(map)
     m.make_wide()
     m.move_robot()
-    print(f"Sum of GPS coordinates of all boxes after all moves for the wide map: {m.sum_of_boxes_gps_coordinates()}")
+    return m.sum_of_boxes_gps_coordinates()
+
+
+def main():
+    print_day(15, TITLE)
+
+    map = parse(get_input(15))
+
+    # Part One: Find the sum of the GPS coordinates of all boxes after all moves.
+    print(f"Sum of GPS coordinates of all boxes after all moves: {part_one(map)}")
+
+    # Part Two: Find the sum of the GPS coordinates of all boxes after all moves with a wide map.
+    print(f"Sum of GPS coordinates of all boxes after all moves for the wide map: {part_two(map)}")
 
 
 if __name__ == "__main__":
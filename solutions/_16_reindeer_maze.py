@@ -2,21 +2,15 @@ from __future__ import annotations
 
 import heapq
 import sys
-from calendar import c
 from collections import deque
 from enum import Enum, StrEnum
-from importlib.resources import files
 from math import sqrt
 from typing import ClassVar, NamedTuple, cast
 
 from . import print_day
+from .puzzle_input import PuzzleInput, get_input
 
-sys.setrecursionlimit(10000)
-
-
-def get_input() -> str:
-    with (files("solutions.inputs") / "16.txt").open() as file:
-        return file.read()
+TITLE = "Reindeer Maze"
 
 
 class TileType(StrEnum):
@@ -189,7 +183,13 @@ class Maze:
                 move_type = MoveType.TURN
             node.visited = False
 
-        solve_recursive(self.start_node, Distance.EAST, [])
+        # the recursion goes as deep as the longest path through the maze
+        recursion_limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(recursion_limit, 10000))
+        try:
+            solve_recursive(self.start_node, Distance.EAST, [])
+        finally:
+            sys.setrecursionlimit(recursion_limit)
         return all_solutions
 
     def solve_iterative(self) -> list[Solution]:
@@ -253,7 +253,6 @@ class Maze:
                     path.append(move)
                     current = move.from_node
                 path.reverse()
-                print(f"found solution {len(path)}, {node_cost[end_node]}")
                 return Solution(path)
 
             heap.remove((current, direction))
@@ -286,16 +285,29 @@ def print_solved_maze(maze: Maze, solution: Solution):
     print("\n".join("".join(str(node) for node in row) for row in nodes))
 
 
-def main():
-    print_day(16, "Reindeer Maze")
+def parse(input: PuzzleInput) -> Maze:
+    return Maze(input.text())
 
-    # Part One: Find the lowest score for solutions of the maze.
-    maze = Maze(get_input())
+
+def part_one(maze: Maze) -> int:
     # solutions = maze.solve()
     # lowest_score = min(solution.score for solution in solutions)
-    # print(f"Lowest score: {lowest_score}")
     solution = maze.solve_a_star()
-    print(f"Lowest score: {solution.score}")
+    return solution.score
+
+
+def part_two(maze: Maze) -> None:
+    # not solved yet
+    return None
+
+
+def main():
+    print_day(16, TITLE)
+
+    maze = parse(get_input(16))
+
+    # Part One: Find the lowest score for solutions of the maze.
+    print(f"Lowest score: {part_one(maze)}")
 
     # Part Two:
 
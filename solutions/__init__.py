@@ -1,6 +1,26 @@
 from __future__ import annotations
 
+from functools import cache
+from types import ModuleType
+
+
 def print_day(day: int, name: str = "") -> None:
     print("=" * 25)
     print(f"Day {day:02}{f': {name}' if name else ''}")
-    print("=" * 25)
\ No newline at end of file
+    print("=" * 25)
+
+
+@cache
+def import_numpy() -> ModuleType | None:
+    """
+    Returns the `numpy` module, or None if it isn't installed.
+
+    NumPy is an optional dependency that only speeds up some of the solutions. It is imported on first use instead of
+    at the top of the solution modules, since importing it takes longer than importing all the solutions together.
+    """
+
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
@@ -1,37 +1,260 @@
+import argparse
+import os
 import sys
-from importlib import import_module
-
-day = None
-if len(sys.argv) == 2:
-    day = int(sys.argv[1])
-
-SOLUTIONS = {
-    1: "_01_historian_hysteria",
-    2: "_02_red_nosed_reports",
-    3: "_03_mull_it_over",
-    4: "_04_ceres_search",
-    5: "_05_print_queue",
-    6: "_06_guard_gallivant",
-    7: "_07_bridge_repair",
-    8: "_08_resonant_collinearity",
-    9: "_09_disk_fragmenter",
-    10: "_10_hoof_it",
-    11: "_11_plutonian_pebbles",
-    12: "_12_garden_groups",
-    13: "_13_claw_contraption",
-    14: "_14_restroom_redoubt",
-    15: "_15_warehouse_woes",
-    16: "_16_reindeer_maze",
-}
-
-if day is not None:
-    try:
-        module = import_module(f".{SOLUTIONS[day]}", package="solutions")
-        module.main()
-    except KeyError:
-        print(f"No solution for day {day} yet.")
+from pathlib import Path
+
+# the tooling modules (batch, bench, generators, memory and profiling) are only imported when they are used, so that
+# just running a day doesn't pay for importing multiprocessing, cProfile, tracemalloc and so on
+from .cache import AnswerCache
+from .puzzle_input import PuzzleInput
+from .runner import SOLUTIONS, run_day, run_days
+
+parser = argparse.ArgumentParser(prog="python -m solutions", description="Run the Advent of Code 2024 solutions.")
+parser.add_argument("day", type=int, nargs="?", help="only run the solution for this day (1-indexed)")
+parser.add_argument(
+    "input",
+    nargs="?",
+    help="run the day on this input file instead of its puzzle input, or on stdin for '-'",
+)
+parser.add_argument(
+    "-j",
+    "--jobs",
+    type=int,
+    nargs="?",
+    default=1,
+    const=os.cpu_count(),
+    help="number of worker processes to run the days in, or to split a single day's work between if the day supports"
+    " it (default: 1, without a value: number of CPUs)",
+)
+parser.add_argument(
+    "--timeout",
+    type=float,
+    metavar="SECONDS",
+    help="stop a day's solution after this many seconds and continue with the next day (runs the days one by one)",
+)
+parser.add_argument(
+    "--inputs",
+    type=Path,
+    metavar="DIR",
+    help="run the given day on every input file in this directory and print the answers as JSON lines",
+)
+
+cache = parser.add_argument_group("answer cache")
+cache.add_argument(
+    "--cache",
+    action="store_true",
+    help="reuse the answers of previous runs as long as the input and the solution's source are unchanged",
+)
+cache.add_argument(
+    "--cache-dir", type=Path, default=Path(".answer_cache"), help="directory of the cache (default: .answer_cache)"
+)
+cache.add_argument(
+    "--cache-max-size",
+    type=float,
+    default=10,
+    metavar="MB",
+    help="evict the least recently used answers once the cache is larger than this (default: 10)",
+)
+cache.add_argument(
+    "--cache-max-age",
+    type=float,
+    default=30,
+    metavar="DAYS",
+    help="evict answers that haven't been used for this many days (default: 30)",
+)
+
+bench = parser.add_argument_group("benchmarking")
+bench.add_argument(
+    "--bench", action="store_true", help="time parsing and both parts instead of printing the solutions"
+)
+bench.add_argument(
+    "--scaling",
+    action="store_true",
+    help="time the solutions on generated inputs of increasing size and fit their growth rate",
+)
+bench.add_argument(
+    "--repeat", type=int, help="number of timed runs per day (default: 5, with --scaling: 3 per input size)"
+)
+bench.add_argument(
+    "--output",
+    type=Path,
+    help="path of the JSON benchmark report (default: bench_report.json, with --scaling: scaling_report.json)",
+)
+bench.add_argument(
+    "--import-budget",
+    type=float,
+    metavar="MS",
+    help="fail if importing a day's module takes longer than this many milliseconds",
+)
+
+bench.add_argument(
+    "--scales",
+    type=float,
+    nargs="+",
+    default=[1, 2, 4, 8],
+    metavar="SCALE",
+    help="sizes of the generated inputs for --scaling, relative to the real input (default: 1 2 4 8)",
+)
+bench.add_argument(
+    "--max-exponent",
+    type=float,
+    metavar="K",
+    help="with --scaling, fail if the time of a phase grows faster than size^K",
+)
+
+memory = parser.add_argument_group("memory")
+memory.add_argument(
+    "--mem",
+    action="store_true",
+    help="report the peak traced memory and the top allocation sites of parsing and both parts",
+)
+memory.add_argument("--mem-top", type=int, default=5, help="number of allocation sites to print per phase (default: 5)")
+memory.add_argument(
+    "--mem-budget",
+    type=float,
+    metavar="MB",
+    help="with --mem or --bench, fail if the peak memory of a phase exceeds this many megabytes",
+)
+memory.add_argument(
+    "--stream-memory",
+    type=float,
+    metavar="MiB",
+    help="with the input '-', the memory a day may use for the input before it sorts it in runs on disk (only day 1,"
+    " default: 256)",
+)
+
+generate = parser.add_argument_group("synthetic inputs")
+generate.add_argument(
+    "--generate", action="store_true", help="print a generated input for the given day instead of solving it"
+)
+generate.add_argument(
+    "--scale", type=float, default=1, help="size of the generated input, relative to the real input (default: 1)"
+)
+generate.add_argument("--seed", type=int, default=0, help="seed of the generated inputs (default: 0)")
+
+profile = parser.add_argument_group("profiling")
+profile.add_argument(
+    "--profile",
+    action="store_true",
+    help="run the given day under cProfile and write .pstats and collapsed stack files for each phase",
+)
+profile.add_argument(
+    "--profile-dir",
+    type=Path,
+    default=Path("profiles"),
+    help="directory for the profiling output (default: profiles)",
+)
+profile.add_argument(
+    "--profile-top", type=int, default=15, help="number of functions to print per phase (default: 15)"
+)
+
+args = parser.parse_args()
+
+answer_cache = (
+    AnswerCache(args.cache_dir, max_size=int(args.cache_max_size * 1_000_000), max_age=args.cache_max_age * 86_400)
+    if args.cache
+    else None
+)
+
+
+def exit_if_over_memory_budget(results) -> None:
+    if args.mem_budget is None:
+        return
+    from .bench import format_bytes
+    from .memory import check_memory_budget
+
+    over_budget = check_memory_budget(results, int(args.mem_budget * 1_000_000))
+    for result, phase, peak_memory in over_budget:
+        print(
+            f"Day {result.day:02} {phase} exceeds the memory budget of {args.mem_budget}MB: {format_bytes(peak_memory)}"
+        )
+    if over_budget:
+        sys.exit(1)
+
+
+if args.input is not None and (
+    args.timeout is not None
+    or args.inputs is not None
+    or args.generate
+    or args.profile
+    or args.mem
+    or args.scaling
+    or args.bench
+):
+    parser.error("an input can only be given when just running a day")
+if args.stream_memory is not None and args.input != "-":
+    parser.error("--stream-memory requires the input '-'")
+
+if args.day is not None and args.day not in SOLUTIONS:
+    print(f"No solution for day {args.day} yet.")
+elif args.inputs is not None:
+    if args.day is None:
+        parser.error("--inputs requires a day")
+    if not args.inputs.is_dir():
+        parser.error(f"--inputs: {args.inputs} is not a directory")
+    from .batch import run_batch
+
+    if run_batch(args.day, args.inputs, jobs=args.jobs):
+        sys.exit(1)
+elif args.generate:
+    if args.day is None:
+        parser.error("--generate requires a day")
+    from .generators import generate_input
+
+    sys.stdout.write(generate_input(args.day, args.scale, seed=args.seed))
+elif args.profile:
+    if args.day is None:
+        parser.error("--profile requires a day")
+    from .profiling import profile_day
+
+    profile_day(args.day, args.profile_dir, top=args.profile_top)
+elif args.mem:
+    from .memory import run_memory
+
+    exit_if_over_memory_budget(run_memory([args.day] if args.day is not None else SOLUTIONS, top=args.mem_top))
+elif args.scaling:
+    from .bench import check_growth, run_scaling_benchmarks
+
+    results = run_scaling_benchmarks(
+        [args.day] if args.day is not None else SOLUTIONS,
+        args.scales,
+        repeat=args.repeat or 3,
+        seed=args.seed,
+        output=args.output or Path("scaling_report.json"),
+    )
+    if args.max_exponent is not None and (too_fast := check_growth(results, args.max_exponent)):
+        for result, phase in too_fast:
+            print(
+                f"Day {result.day:02} {phase} grows faster than size^{args.max_exponent}:"
+                f" size^{result.exponents[phase]:.2f}"
+            )
+        sys.exit(1)
+elif args.bench:
+    from .bench import check_import_budget, format_seconds, run_benchmarks
+
+    results = run_benchmarks(
+        [args.day] if args.day is not None else SOLUTIONS,
+        repeat=args.repeat or 5,
+        output=args.output or Path("bench_report.json"),
+    )
+    if args.import_budget is not None and (over_budget := check_import_budget(results, args.import_budget / 1000)):
+        for result in over_budget:
+            print(
+                f"Day {result.day:02} exceeds the import budget of {args.import_budget}ms:"
+                f" {format_seconds(result.import_time)}"
+            )
+        sys.exit(1)
+    exit_if_over_memory_budget(results)
+elif args.day is not None:
+    if args.input == "-":
+        input = PuzzleInput.from_stream(sys.stdin.buffer)
+    elif args.input is not None:
+        input = PuzzleInput.from_path(Path(args.input))
+    else:
+        input = None
+    memory_budget = int(args.stream_memory * 1024 * 1024) if args.stream_memory is not None else None
+    run_day(
+        args.day, jobs=args.jobs, cache=answer_cache, timeout=args.timeout, input=input, memory_budget=memory_budget
+    )
 else:
-    for _, module_name in SOLUTIONS.items():
-        module = import_module(f".{module_name}", package="solutions")
-        module.main()
-        print()
+    run_days(SOLUTIONS, jobs=args.jobs, cache=answer_cache, timeout=args.timeout)
@@ -1,21 +1,33 @@
 from __future__ import annotations
 
-from importlib.resources import files
-
 from . import print_day
+from .puzzle_input import PuzzleInput, get_input
+
+TITLE = ""
+
+
+def parse(input: PuzzleInput):
+    return input.text()
 
 
-def get_input() -> str:
-    with (files("solutions.inputs") / "xx.txt").open() as file:
-        return file.read()
+def part_one(parsed) -> int:
+    pass
+
+
+def part_two(parsed) -> int:
+    pass
 
 
 def main():
-    print_day(x, "")
+    print_day(x, TITLE)
+
+    parsed = parse(get_input(x))
 
     # Part One:
+    print(f"{part_one(parsed)}")
 
     # Part Two:
+    print(f"{part_two(parsed)}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from time import perf_counter
+from types import ModuleType
+from typing import Any, Iterator
+
+from .puzzle_input import PuzzleInput
+from .runner import load_solution, solve
+
+# the solution module of the day that is being run, imported once per worker process by `init_worker`
+worker_module: ModuleType | None = None
+
+
+def init_worker(day: int) -> None:
+    global worker_module
+    worker_module = load_solution(day)
+
+
+def solve_file(path: str) -> dict[str, Any]:
+    """
+    Solves the puzzle for the input file at `path` with the solution module of the worker.
+
+    Errors are reported in the result instead of being raised, so that one broken input doesn't stop the whole batch.
+    """
+
+    start = perf_counter()
+    try:
+        answers = solve(worker_module, PuzzleInput.from_path(Path(path)))
+    except Exception as error:
+        return {"input": path, "error": f"{type(error).__name__}: {error}", "seconds": perf_counter() - start}
+    return {
+        "input": path,
+        "part_one": answers.part_one,
+        "part_two": answers.part_two,
+        "seconds": perf_counter() - start,
+    }
+
+
+def solve_files(day: int, paths: list[str], *, jobs: int = 1) -> Iterator[dict[str, Any]]:
+    """
+    Solves the puzzle of the given day for every input file in `paths`.
+
+    With `jobs > 1` the inputs are solved in a pool of worker processes, which import the solution module only once.
+    The results are yielded as soon as they are finished, i.e. not necessarily in the order of `paths`.
+    """
+
+    if not paths:
+        return
+    if jobs <= 1:
+        init_worker(day)
+        yield from map(solve_file, paths)
+        return
+
+    from multiprocessing import Pool
+
+    # send the inputs in small chunks to reduce the overhead per input, but keep the chunks small enough that the
+    # results are still streamed and the work is evenly distributed
+    chunksize = max(1, min(16, len(paths) // (jobs * 4)))
+    with Pool(min(jobs, len(paths)), initializer=init_worker, initargs=(day,)) as pool:
+        yield from pool.imap_unordered(solve_file, paths, chunksize=chunksize)
+
+
+def run_batch(day: int, directory: Path, *, jobs: int = 1) -> int:
+    """
+    Runs the solution for the given day on every file in `directory` and prints the results as JSON lines.
+
+    Returns the number of inputs that failed.
+    """
+
+    paths = sorted(str(path) for path in directory.iterdir() if path.is_file())
+    failed = 0
+    for result in solve_files(day, paths, jobs=jobs):
+        failed += "error" in result
+        print(json.dumps(result, default=str), flush=True)
+    return failed
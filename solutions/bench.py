@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+import json
+import math
+import platform
+import statistics
+import subprocess
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from types import ModuleType
+from typing import Callable, Iterable, Iterator, NamedTuple
+
+from .generators import generate_input
+from .puzzle_input import PuzzleInput, input_path
+from .runner import SOLUTIONS, load_solution
+
+
+class PhaseResult(NamedTuple):
+    name: str
+    samples: list[float]
+    peak_memory: int
+
+    @property
+    def min(self) -> float:
+        return min(self.samples)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def p95(self) -> float:
+        # nearest-rank percentile, so that the value is always one of the measured samples
+        samples = sorted(self.samples)
+        return samples[math.ceil(0.95 * len(samples)) - 1]
+
+    def to_dict(self) -> dict:
+        return {
+            "min": self.min,
+            "median": self.median,
+            "p95": self.p95,
+            "peak_memory": self.peak_memory,
+            "samples": self.samples,
+        }
+
+
+class DayResult(NamedTuple):
+    day: int
+    module: str
+    import_time: float
+    phases: list[PhaseResult]
+
+    def to_dict(self) -> dict:
+        return {
+            "module": self.module,
+            "import_time": self.import_time,
+            "phases": {phase.name: phase.to_dict() for phase in self.phases},
+        }
+
+
+class ScalingResult(NamedTuple):
+    day: int
+    module: str
+    scales: list[float]
+    sizes: list[int]
+    # the results of every phase for each of the scales
+    phases: dict[str, list[PhaseResult]]
+
+    @property
+    def exponents(self) -> dict[str, float]:
+        return {
+            name: fit_exponent(self.sizes, [phase.median for phase in results]) for name, results in self.phases.items()
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "module": self.module,
+            "scales": self.scales,
+            "sizes": self.sizes,
+            "phases": {
+                name: {"exponent": self.exponents[name], "results": [phase.to_dict() for phase in results]}
+                for name, results in self.phases.items()
+            },
+        }
+
+
+def measure_import_time(module_name: str) -> float:
+    """
+    Measures how long importing a solution module takes, in seconds.
+
+    The module is imported in a fresh interpreter with `-X importtime`, so nothing is cached from previous imports and
+    the measurement includes everything the module imports (including the `solutions` package itself).
+    """
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import solutions.{module_name}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # every line looks like "import time: <self [us]> | <cumulative [us]> | <indentation><imported package>"
+    cumulative_us = 0
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, package = line.removeprefix("import time:").split("|")
+        if package.strip() in ("solutions", f"solutions.{module_name}"):
+            cumulative_us += int(cumulative)
+    return cumulative_us / 1_000_000
+
+
+def run_phases(
+    module: ModuleType, load_input: Callable[[], PuzzleInput]
+) -> Iterator[tuple[str, Callable[[], object]]]:
+    """
+    Yields the name and a callable for parsing and both parts of the given solution module.
+
+    The parsed input is shared between both parts, just like in `runner.solve`. Each run calls `load_input` anew
+    instead of using the cached `get_input`, so that reading and decoding the input counts towards the parse timings.
+    """
+
+    parsed = None
+
+    def parse():
+        nonlocal parsed
+        parsed = module.parse(load_input())
+
+    yield "parse", parse
+    yield "part_one", lambda: module.part_one(parsed)
+    yield "part_two", lambda: module.part_two(parsed)
+
+
+def warm_up(module: ModuleType, load_input: Callable[[], PuzzleInput]) -> None:
+    """
+    Runs every phase once, so that lazy imports (e.g. of NumPy) and caches filled on first use aren't measured.
+    """
+
+    for _, phase in run_phases(module, load_input):
+        phase()
+
+
+def time_phases(module: ModuleType, load_input: Callable[[], PuzzleInput], *, repeat: int) -> list[PhaseResult]:
+    """
+    Times every phase of the given solution module `repeat` times, after an untimed warm-up run.
+
+    The peak memory of each phase is measured in one additional run with `tracemalloc` enabled, so that the tracing
+    overhead doesn't distort the timings.
+    """
+
+    warm_up(module, load_input)
+    samples: dict[str, list[float]] = {}
+    for _ in range(repeat):
+        for name, phase in run_phases(module, load_input):
+            start = perf_counter()
+            phase()
+            samples.setdefault(name, []).append(perf_counter() - start)
+
+    peak_memory: dict[str, int] = {}
+    tracemalloc.start()
+    try:
+        for name, phase in run_phases(module, load_input):
+            tracemalloc.reset_peak()
+            phase()
+            peak_memory[name] = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return [PhaseResult(name, phase_samples, peak_memory[name]) for name, phase_samples in samples.items()]
+
+
+def benchmark_day(day: int, *, repeat: int = 5) -> DayResult:
+    """
+    Times every phase of the solution for the given day `repeat` times.
+    """
+
+    return DayResult(
+        day,
+        SOLUTIONS[day],
+        measure_import_time(SOLUTIONS[day]),
+        time_phases(load_solution(day), lambda: PuzzleInput.from_path(input_path(day)), repeat=repeat),
+    )
+
+
+def fit_exponent(sizes: list[int], times: list[float]) -> float:
+    """
+    Fits `time = c * size ** k` to the measurements and returns the growth rate `k`.
+
+    `k` is the slope of the least-squares line through the measurements on a log-log scale, so ~1 is linear, ~2 is
+    quadratic, etc. Returns NaN if there aren't at least two different sizes.
+    """
+
+    xs = [math.log(size) for size in sizes]
+    # timings of (almost) no-op phases can be 0 on platforms with a coarse clock
+    ys = [math.log(max(time, 1e-9)) for time in times]
+    mean_x, mean_y = statistics.fmean(xs), statistics.fmean(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    if variance == 0:
+        return math.nan
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+
+
+def benchmark_scaling(day: int, scales: Iterable[float], *, repeat: int = 3, seed: int = 0) -> ScalingResult:
+    """
+    Times every phase of the solution for the given day on generated inputs of different `scales`.
+
+    A scale of 1 corresponds to roughly the size of the real puzzle input. The growth rate is fitted against the
+    actual size of the generated inputs in bytes.
+    """
+
+    module = load_solution(day)
+    scales = list(scales)
+    sizes = []
+    phases: dict[str, list[PhaseResult]] = {}
+    for scale in scales:
+        data = generate_input(day, scale, seed=seed).encode()
+        sizes.append(len(data))
+        for phase in time_phases(module, lambda: PuzzleInput(data), repeat=repeat):
+            phases.setdefault(phase.name, []).append(phase)
+    return ScalingResult(day, SOLUTIONS[day], scales, sizes, phases)
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.3f}s"
+
+
+def format_bytes(size: int) -> str:
+    if size < 1024:
+        return f"{size}B"
+    for unit in ("KiB", "MiB"):
+        size /= 1024
+        if size < 1024:
+            return f"{size:.1f}{unit}"
+    return f"{size / 1024:.1f}GiB"
+
+
+def print_day_result(result: DayResult) -> None:
+    print(f"Day {result.day:02} ({result.module}), import time: {format_seconds(result.import_time)}")
+    print(f"  {'phase':<10} {'min':>10} {'median':>10} {'p95':>10} {'peak mem':>10}")
+    for phase in result.phases:
+        print(
+            f"  {phase.name:<10} {format_seconds(phase.min):>10} {format_seconds(phase.median):>10}"
+            f" {format_seconds(phase.p95):>10} {format_bytes(phase.peak_memory):>10}"
+        )
+
+
+def print_scaling_result(result: ScalingResult) -> None:
+    print(f"Day {result.day:02} ({result.module}), median times by input size")
+    print(f"  {'phase':<10}" + "".join(f" {format_bytes(size):>10}" for size in result.sizes) + f" {'growth':>8}")
+    for name, results in result.phases.items():
+        print(
+            f"  {name:<10}"
+            + "".join(f" {format_seconds(phase.median):>10}" for phase in results)
+            + f" {f'n^{result.exponents[name]:.2f}':>8}"
+        )
+
+
+def write_report(results: Iterable[DayResult], path: Path, *, repeat: int) -> None:
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "repeat": repeat,
+        "days": {str(result.day): result.to_dict() for result in results},
+    }
+    path.write_text(json.dumps(report, indent=2) + "\n")
+
+
+def write_scaling_report(results: Iterable[ScalingResult], path: Path, *, repeat: int, seed: int) -> None:
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "repeat": repeat,
+        "seed": seed,
+        "days": {str(result.day): result.to_dict() for result in results},
+    }
+    path.write_text(json.dumps(report, indent=2) + "\n")
+
+
+def check_growth(results: Iterable[ScalingResult], max_exponent: float) -> list[tuple[ScalingResult, str]]:
+    """
+    Returns the results and names of all phases whose fitted growth rate is higher than `max_exponent`.
+    """
+
+    return [
+        (result, name) for result in results for name, exponent in result.exponents.items() if exponent > max_exponent
+    ]
+
+
+def check_import_budget(results: Iterable[DayResult], budget: float) -> list[DayResult]:
+    """
+    Returns the results of all days whose module took longer than `budget` seconds to import.
+    """
+
+    return [result for result in results if result.import_time > budget]
+
+
+def run_benchmarks(days: Iterable[int], *, repeat: int = 5, output: Path | None = None) -> list[DayResult]:
+    results = []
+    for day in days:
+        result = benchmark_day(day, repeat=repeat)
+        print_day_result(result)
+        results.append(result)
+
+    if output is not None:
+        write_report(results, output, repeat=repeat)
+        print(f"Benchmark report written to {output}")
+    return results
+
+
+def run_scaling_benchmarks(
+    days: Iterable[int],
+    scales: Iterable[float],
+    *,
+    repeat: int = 3,
+    seed: int = 0,
+    output: Path | None = None,
+) -> list[ScalingResult]:
+    scales = list(scales)
+    results = []
+    for day in days:
+        result = benchmark_scaling(day, scales, repeat=repeat, seed=seed)
+        print_scaling_result(result)
+        results.append(result)
+
+    if output is not None:
+        write_scaling_report(results, output, repeat=repeat, seed=seed)
+        print(f"Scaling report written to {output}")
+    return results
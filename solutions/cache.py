@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from .puzzle_input import PuzzleInput
+
+
+class AnswerCache:
+    """
+    A content-addressed on-disk cache for the answers of the puzzles.
+
+    Every entry is a small JSON file in `directory` named after the hash of the puzzle input and the source of the
+    solution module, so changing either of them automatically misses the cache. Reading an entry refreshes its
+    modification time, which is used to evict the least recently used entries once they exceed `max_age` (seconds)
+    or the whole cache exceeds `max_size` (bytes).
+    """
+
+    directory: Path
+    max_size: int | None
+    max_age: float | None
+
+    def __init__(self, directory: Path, *, max_size: int | None = None, max_age: float | None = None) -> None:
+        self.directory = directory
+        self.max_size = max_size
+        self.max_age = max_age
+
+    @staticmethod
+    def key(module: ModuleType, input: PuzzleInput) -> str:
+        digest = hashlib.sha256()
+        digest.update(Path(module.__file__).read_bytes())
+        digest.update(b"\0")
+        digest.update(input.buffer())
+        return digest.hexdigest()
+
+    def __path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> tuple[Any, Any] | None:
+        path = self.__path(key)
+        try:
+            entry = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        os.utime(path)
+        return entry["part_one"], entry["part_two"]
+
+    def put(self, key: str, part_one: Any, part_two: Any) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first, so that parallel workers never read a partially written entry
+        path = self.__path(key)
+        temporary_path = path.with_suffix(f".{os.getpid()}.tmp")
+        temporary_path.write_text(json.dumps({"part_one": part_one, "part_two": part_two}))
+        temporary_path.replace(path)
+
+    def evict(self) -> int:
+        """
+        Removes the entries that are older than `max_age` and then the least recently used entries until the cache
+        is no larger than `max_size`.
+
+        Returns the number of removed entries.
+        """
+
+        if not self.directory.is_dir():
+            return 0
+
+        entries = sorted(
+            ((path, path.stat()) for path in self.directory.glob("*.json")), key=lambda entry: entry[1].st_mtime
+        )
+        now = time.time()
+        size = sum(stat.st_size for _, stat in entries)
+
+        removed = 0
+        for path, stat in entries:
+            too_old = self.max_age is not None and now - stat.st_mtime > self.max_age
+            too_large = self.max_size is not None and size > self.max_size
+            if not too_old and not too_large:
+                break
+            path.unlink(missing_ok=True)
+            size -= stat.st_size
+            removed += 1
+        return removed
@@ -0,0 +1,302 @@
+"""
+Generators for synthetic puzzle inputs of configurable size.
+
+Every generator takes a `scale` and a `random.Random` and returns a valid input for its day. At scale 1 the generated
+input is roughly as large as the real puzzle input; the number of lines, grid cells, etc. grows linearly with the
+scale (grids grow by `sqrt(scale)` in each dimension).
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import string
+from typing import Callable
+
+
+def scaled(count: int, scale: float, minimum: int = 1) -> int:
+    return max(minimum, round(count * scale))
+
+
+def scaled_side(side: int, scale: float, minimum: int = 4) -> int:
+    return max(minimum, round(side * math.sqrt(scale)))
+
+
+def grid_to_str(grid: list[list[str]]) -> str:
+    return "".join("".join(row) + "\n" for row in grid)
+
+
+def generate_01(scale: float, rng: random.Random) -> str:
+    left = [rng.randint(10000, 99999) for _ in range(scaled(1000, scale))]
+    # about half of the right list are IDs from the left list, so that the similarity score isn't trivially zero
+    right = [rng.choice(left) if rng.random() < 0.5 else rng.randint(10000, 99999) for _ in left]
+    return "".join(f"{a}   {b}\n" for a, b in zip(left, right))
+
+
+def generate_02(scale: float, rng: random.Random) -> str:
+    # the reports get longer with the scale instead of more numerous, so that work that is quadratic in the length of
+    # a report (e.g. for the problem dampener) shows up in the scaling benchmarks
+    lines = []
+    for _ in range(1000):
+        direction = rng.choice((-1, 1))
+        levels = [rng.randint(10, 90)]
+        for _ in range(scaled(rng.randint(4, 7), scale)):
+            levels.append(levels[-1] + direction * rng.randint(1, 3))
+        if rng.random() < 0.5:
+            # introduce a bad level, which the problem dampener may or may not be able to remove
+            levels[rng.randrange(len(levels))] += rng.choice((-4, 0, 4))
+        lines.append(" ".join(map(str, levels)))
+    return "\n".join(lines) + "\n"
+
+
+def generate_03(scale: float, rng: random.Random) -> str:
+    GARBAGE = "!@#$%^&*()[]{}<>?:;+-_,' whyfromselectwhowhere"
+    fragments = []
+    length = 0
+    while length < 18_000 * scale:
+        match rng.random():
+            case p if p < 0.15:
+                fragment = f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+            case p if p < 0.18:
+                fragment = "do()"
+            case p if p < 0.21:
+                fragment = "don't()"
+            case p if p < 0.25:
+                # corrupted instructions
+                fragment = rng.choice(("mul[3,7]", "mul(32,64]", "mul ( 2 , 4 )", "do_not_mul(5,5)", "undo("))
+            case _:
+                fragment = "".join(rng.choices(GARBAGE, k=rng.randint(1, 8)))
+        fragments.append(fragment)
+        length += len(fragment)
+        if rng.random() < 0.001:
+            fragments.append("\n")
+    return "".join(fragments) + "\n"
+
+
+def generate_04(scale: float, rng: random.Random) -> str:
+    side = scaled_side(140, scale)
+    return grid_to_str([rng.choices("XMAS", k=side) for _ in range(side)])
+
+
+def generate_05(scale: float, rng: random.Random) -> str:
+    # all pairs of pages have an ordering rule, just like in the real input
+    number_of_pages = max(23, round(49 * math.sqrt(scale)))
+    pages = rng.sample(range(10, 10 + 2 * number_of_pages), number_of_pages)
+    rules = [(a, b) for i, a in enumerate(pages) for b in pages[i + 1 :]]
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(scaled(200, scale)):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(",".join(map(str, update)))
+
+    return "\n".join(f"{a}|{b}" for a, b in rules) + "\n\n" + "\n".join(updates) + "\n"
+
+
+def guard_path(grid: list[list[str]], x: int, y: int) -> set[tuple[int, int]] | None:
+    """
+    Returns the cells the guard visits before leaving the map, or None if the guard walks in a loop.
+    """
+
+    dx, dy = 0, -1
+    seen = set()
+    while (x, y, dx, dy) not in seen:
+        seen.add((x, y, dx, dy))
+        if not (0 <= x + dx < len(grid[0]) and 0 <= y + dy < len(grid)):
+            return {(x, y) for x, y, _, _ in seen}
+        if grid[y + dy][x + dx] == "#":
+            dx, dy = -dy, dx
+        else:
+            x, y = x + dx, y + dy
+    return None
+
+
+def generate_06(scale: float, rng: random.Random) -> str:
+    side = scaled_side(130, scale)
+    grid = [["." for _ in range(side)] for _ in range(side)]
+
+    # the guard walks an outward spiral with a random distance between its rings, so that it visits a good part of the
+    # map before leaving it, like in the real inputs. Every leg is longer than the previous leg in the same direction
+    # by at least 2, so no obstacle at the end of a leg is ever in the way of a later, outer leg.
+    start_x, start_y = side // 2 + rng.randint(-side // 8, side // 8), side // 2 + rng.randint(-side // 8, side // 8)
+    x, y, dx, dy = start_x, start_y, 0, -1
+    legs = [0, 0]
+    while True:
+        length = legs[-2] + rng.randint(2, 4)
+        obstacle_x, obstacle_y = x + dx * (length + 1), y + dy * (length + 1)
+        if not (0 <= obstacle_x < side and 0 <= obstacle_y < side):
+            # the guard leaves the map on this leg
+            break
+        grid[obstacle_y][obstacle_x] = "#"
+        x, y = x + dx * length, y + dy * length
+        dx, dy = -dy, dx
+        legs.append(length)
+
+    # scatter more obstacles off the path, which only matter for the new obstructions of part two
+    path = guard_path(grid, start_x, start_y)
+    for cell_y in range(side):
+        for cell_x in range(side):
+            if (cell_x, cell_y) not in path and rng.random() < 0.02:
+                grid[cell_y][cell_x] = "#"
+    grid[start_y][start_x] = "^"
+    return grid_to_str(grid)
+
+
+def generate_07(scale: float, rng: random.Random) -> str:
+    lines = []
+    for _ in range(scaled(850, scale)):
+        operands = [rng.randint(1, 999) for _ in range(rng.randint(2, 12))]
+        if rng.random() < 0.5:
+            result = operands[0]
+            for operand in operands[1:]:
+                result = rng.choice((result + operand, result * operand, int(f"{result}{operand}")))
+        else:
+            result = rng.randint(1, 10**12)
+        lines.append(f"{result}: {' '.join(map(str, operands))}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_08(scale: float, rng: random.Random) -> str:
+    side = scaled_side(50, scale)
+    grid = [["." for _ in range(side)] for _ in range(side)]
+    cells = rng.sample(range(side * side), min(scaled(200, scale), side * side // 4))
+    for cell in cells:
+        grid[cell // side][cell % side] = rng.choice(string.digits + string.ascii_letters)
+    return grid_to_str(grid)
+
+
+def generate_09(scale: float, rng: random.Random) -> str:
+    # the disk map must start and end with a file
+    length = scaled(19_999, scale) | 1
+    return "".join(str(rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9)) for i in range(length)) + "\n"
+
+
+def generate_10(scale: float, rng: random.Random) -> str:
+    side = scaled_side(45, scale)
+    # a sloped landscape with some noise contains many more hiking trails than random heights
+    return grid_to_str(
+        [[str((x + y + rng.choice((-1, 0, 0, 1))) % 10) for x in range(side)] for y in range(side)]
+    )
+
+
+def generate_11(scale: float, rng: random.Random) -> str:
+    return " ".join(str(rng.randint(0, 9_999_999)) for _ in range(scaled(8, scale))) + "\n"
+
+
+def generate_12(scale: float, rng: random.Random) -> str:
+    side = scaled_side(140, scale)
+    PATCH = 6
+    patches = [
+        [rng.choice(string.ascii_uppercase) for _ in range(side // PATCH + 1)] for _ in range(side // PATCH + 1)
+    ]
+    grid = [
+        [
+            rng.choice(string.ascii_uppercase) if rng.random() < 0.05 else patches[y // PATCH][x // PATCH]
+            for x in range(side)
+        ]
+        for y in range(side)
+    ]
+    return grid_to_str(grid)
+
+
+def generate_13(scale: float, rng: random.Random) -> str:
+    machines = []
+    for _ in range(scaled(320, scale)):
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        while ax * by == ay * bx:
+            # like in the real inputs, the buttons never move the claw in the same direction
+            bx, by = rng.randint(10, 99), rng.randint(10, 99)
+        if rng.random() < 0.5:
+            a, b = rng.randint(1, 100), rng.randint(1, 100)
+            prize_x, prize_y = a * ax + b * bx, a * ay + b * by
+        else:
+            prize_x, prize_y = rng.randint(1000, 20000), rng.randint(1000, 20000)
+        machines.append(f"Button A: X+{ax}, Y+{ay}\nButton B: X+{bx}, Y+{by}\nPrize: X={prize_x}, Y={prize_y}\n")
+    return "\n".join(machines)
+
+
+def generate_14(scale: float, rng: random.Random) -> str:
+    return "".join(
+        f"p={rng.randrange(101)},{rng.randrange(103)} v={rng.randint(-99, 99)},{rng.randint(-99, 99)}\n"
+        for _ in range(scaled(500, scale))
+    )
+
+
+def generate_15(scale: float, rng: random.Random) -> str:
+    side = scaled_side(50, scale)
+    grid = [
+        [
+            "#" if x in (0, side - 1) or y in (0, side - 1) else rng.choices("#O.", weights=(5, 25, 70))[0]
+            for x in range(side)
+        ]
+        for y in range(side)
+    ]
+    grid[side // 2][side // 2] = "@"
+    moves = "".join(rng.choices("<>^v", k=scaled(20_000, scale)))
+    move_lines = "\n".join(moves[i : i + 1000] for i in range(0, len(moves), 1000))
+    return grid_to_str(grid) + "\n" + move_lines + "\n"
+
+
+def generate_16(scale: float, rng: random.Random) -> str:
+    side = scaled_side(141, scale, minimum=5) | 1
+    grid = [["#" for _ in range(side)] for _ in range(side)]
+
+    # carve a perfect maze with an iterative randomized depth-first search through the odd cells
+    stack = [(1, side - 2)]
+    grid[side - 2][1] = "."
+    while stack:
+        x, y = stack[-1]
+        neighbors = [
+            (x + dx, y + dy)
+            for dx, dy in ((0, -2), (2, 0), (0, 2), (-2, 0))
+            if 0 < x + dx < side - 1 and 0 < y + dy < side - 1 and grid[y + dy][x + dx] == "#"
+        ]
+        if not neighbors:
+            stack.pop()
+            continue
+        nx, ny = rng.choice(neighbors)
+        grid[(y + ny) // 2][(x + nx) // 2] = "."
+        grid[ny][nx] = "."
+        stack.append((nx, ny))
+
+    # open up some walls, so that there are multiple paths through the maze
+    for y in range(1, side - 1):
+        for x in range(1 + y % 2, side - 1, 2):
+            if grid[y][x] == "#" and rng.random() < 0.1:
+                grid[y][x] = "."
+
+    grid[side - 2][1] = "S"
+    grid[1][side - 2] = "E"
+    return grid_to_str(grid)
+
+
+GENERATORS: dict[int, Callable[[float, random.Random], str]] = {
+    1: generate_01,
+    2: generate_02,
+    3: generate_03,
+    4: generate_04,
+    5: generate_05,
+    6: generate_06,
+    7: generate_07,
+    8: generate_08,
+    9: generate_09,
+    10: generate_10,
+    11: generate_11,
+    12: generate_12,
+    13: generate_13,
+    14: generate_14,
+    15: generate_15,
+    16: generate_16,
+}
+
+
+def generate_input(day: int, scale: float = 1, *, seed: int | None = 0) -> str:
+    """
+    Generates a synthetic input for the given day.
+
+    The same `seed` always generates the same input, pass `None` for a different input every time.
+    """
+
+    return GENERATORS[day](scale, random.Random(seed))
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from pathlib import Path
+from types import FrameType, ModuleType
+from typing import Any, Callable, Iterable, NamedTuple
+
+from .bench import DayResult, format_bytes, run_phases, warm_up
+from .puzzle_input import PuzzleInput, input_path
+from .runner import SOLUTIONS, load_solution
+
+
+class PhaseMemory(NamedTuple):
+    name: str
+    peak_memory: int
+    # the allocation sites holding the most memory at (approximately) the time of the peak
+    sites: list[tracemalloc.Statistic]
+
+
+class MemoryResult(NamedTuple):
+    day: int
+    module: str
+    phases: list[PhaseMemory]
+
+
+class PeakSnapshots:
+    """
+    Takes a `tracemalloc` snapshot whenever the traced memory reaches a new peak while running a function.
+
+    The traced memory is checked on every function call and return with `sys.setprofile`, so the last snapshot shows
+    which allocations make up the peak. To keep the overhead bounded, a new snapshot is only taken once the memory
+    exceeds the previous snapshot by `GROWTH`.
+    """
+
+    GROWTH = 1.05
+
+    snapshot: tracemalloc.Snapshot | None
+    __threshold: int
+
+    def __init__(self) -> None:
+        self.snapshot = None
+        self.__threshold = 0
+
+    def __profile(self, frame: FrameType, event: str, arg: Any) -> None:
+        if tracemalloc.get_traced_memory()[0] > self.__threshold:
+            # free the previous snapshot first, so that it doesn't count towards the next one
+            self.snapshot = None
+            self.snapshot = tracemalloc.take_snapshot()
+            self.__threshold = int(tracemalloc.get_traced_memory()[0] * self.GROWTH)
+
+    def runcall(self, function: Callable[[], object]) -> None:
+        sys.setprofile(self.__profile)
+        try:
+            function()
+        finally:
+            sys.setprofile(None)
+
+    def top_sites(self, top: int) -> list[tracemalloc.Statistic]:
+        if self.snapshot is None:
+            return []
+        snapshot = self.snapshot.filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            )
+        )
+        return snapshot.statistics("lineno")[:top]
+
+
+def measure_peaks(module: ModuleType, load_input: Callable[[], PuzzleInput]) -> dict[str, int]:
+    peaks = {}
+    for name, phase in run_phases(module, load_input):
+        tracemalloc.reset_peak()
+        phase()
+        peaks[name] = tracemalloc.get_traced_memory()[1]
+    return peaks
+
+
+def trace_day(day: int, *, top: int = 5) -> MemoryResult:
+    """
+    Measures the peak memory of parsing and both parts of the given day and finds their top allocation sites.
+
+    Like in the benchmarks, the peak of a part includes the parsed input it works on. The peaks are measured in a plain
+    run of all phases and the allocation sites in a second run, since taking the snapshots skews the peaks.
+    """
+
+    module = load_solution(day)
+
+    def load_input() -> PuzzleInput:
+        return PuzzleInput.from_path(input_path(day))
+
+    # run every phase once untraced, so that lazy imports and caches filled on first use don't show up as allocations
+    warm_up(module, load_input)
+
+    tracemalloc.start()
+    try:
+        peaks = measure_peaks(module, load_input)
+        phases = []
+        for name, phase in run_phases(module, load_input):
+            snapshots = PeakSnapshots()
+            snapshots.runcall(phase)
+            phases.append(PhaseMemory(name, peaks[name], snapshots.top_sites(top)))
+    finally:
+        tracemalloc.stop()
+
+    return MemoryResult(day, SOLUTIONS[day], phases)
+
+
+def print_memory_result(result: MemoryResult) -> None:
+    print(f"Day {result.day:02} ({result.module}), peak memory per phase")
+    for phase in result.phases:
+        print(f"  {phase.name}: {format_bytes(phase.peak_memory)}")
+        for site in phase.sites:
+            frame = site.traceback[0]
+            location = f"{Path(frame.filename).name}:{frame.lineno}"
+            print(f"    {format_bytes(site.size):>10} {site.count:>9} blocks  {location}")
+
+
+def run_memory(days: Iterable[int], *, top: int = 5) -> list[MemoryResult]:
+    results = []
+    for day in days:
+        result = trace_day(day, top=top)
+        print_memory_result(result)
+        results.append(result)
+    return results
+
+
+def check_memory_budget(
+    results: Iterable[DayResult | MemoryResult], budget: int
+) -> list[tuple[DayResult | MemoryResult, str, int]]:
+    """
+    Returns the result, the name and the peak memory of all phases that exceeded `budget` bytes.
+    """
+
+    return [
+        (result, phase.name, phase.peak_memory)
+        for result in results
+        for phase in result.phases
+        if phase.peak_memory > budget
+    ]
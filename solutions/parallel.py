@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import re
+from functools import partial
+from importlib.resources.abc import Traversable
+from pathlib import Path
+from typing import Callable, TypeVar
+
+from .puzzle_input import LINE_START, PuzzleInput
+
+Result = TypeVar("Result")
+
+
+def solve_chunk_in_file(
+    function: Callable[[bytes | memoryview], Result], path: Path | Traversable, start: int, end: int
+) -> Result:
+    # the file is mapped by every worker, so that only the offsets have to be sent to it
+    return function(PuzzleInput.from_path(path).buffer()[start:end])
+
+
+def map_chunks(
+    function: Callable[[bytes | memoryview], Result],
+    input: PuzzleInput,
+    jobs: int,
+    boundary: re.Pattern[bytes] = LINE_START,
+) -> list[Result]:
+    """
+    Applies `function` to chunks of the input in `jobs` worker processes and returns the results in order.
+
+    The input is split with `PuzzleInput.line_chunks`, so the chunks end on line boundaries unless another `boundary`
+    is given. For an input read from a file, the workers map the file themselves and are only sent the offsets of
+    their chunks, otherwise they are sent a copy of their chunk's bytes.
+    """
+
+    # the pool is imported here, since importing it takes longer than the solution modules themselves
+    from concurrent.futures import ProcessPoolExecutor
+
+    # a few chunks per worker even out the differences in the time it takes to process them
+    chunks = input.line_chunks(4 * jobs, boundary)
+    starts = [start for start, _ in chunks]
+    ends = [end for _, end in chunks]
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        if input.path is not None:
+            return list(executor.map(partial(solve_chunk_in_file, function, input.path), starts, ends))
+        buffer = input.buffer()
+        return list(executor.map(function, (bytes(buffer[start:end]) for start, end in chunks)))
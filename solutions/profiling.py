@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import cProfile
+import pstats
+import sys
+from pathlib import Path
+from time import perf_counter_ns
+from types import FrameType
+from typing import Any, Callable
+
+from .bench import run_phases, warm_up
+from .puzzle_input import PuzzleInput, input_path
+from .runner import SOLUTIONS, load_solution
+
+
+class StackCollector:
+    """
+    Collects the time spent in every distinct call stack, in the "collapsed stack" format of flamegraph tools.
+
+    Uses `sys.setprofile`, i.e. every Python and C function call is recorded, not just a sample of them. Each line of
+    the output is a `;`-separated stack of functions followed by the time spent in the innermost function (excluding
+    its callees) in microseconds.
+    """
+
+    stacks: dict[str, int]
+    __frames: list[list[Any]]
+
+    def __init__(self) -> None:
+        self.stacks = {}
+        # each frame is [stack, start time, time spent in callees]
+        self.__frames = []
+
+    @staticmethod
+    def __label(frame: FrameType, event: str, arg: Any) -> str:
+        if event == "c_call":
+            return f"{getattr(arg, '__module__', None) or 'builtins'}.{getattr(arg, '__qualname__', arg)}"
+        code = frame.f_code
+        return f"{Path(code.co_filename).name}:{code.co_qualname}:{code.co_firstlineno}"
+
+    def __profile(self, frame: FrameType, event: str, arg: Any) -> None:
+        now = perf_counter_ns()
+        if event in ("call", "c_call"):
+            parent = self.__frames[-1][0] + ";" if self.__frames else ""
+            self.__frames.append([parent + self.__label(frame, event, arg).replace(";", ","), now, 0])
+        elif event in ("return", "c_return", "c_exception") and self.__frames:
+            stack, start, callee_time = self.__frames.pop()
+            elapsed = now - start
+            self.stacks[stack] = self.stacks.get(stack, 0) + elapsed - callee_time
+            if self.__frames:
+                self.__frames[-1][2] += elapsed
+
+    def runcall(self, function: Callable[[], object]) -> None:
+        sys.setprofile(self.__profile)
+        try:
+            function()
+        finally:
+            sys.setprofile(None)
+
+    def dump(self, path: Path) -> None:
+        with path.open("w") as file:
+            for stack, time_ns in sorted(self.stacks.items()):
+                if (time_us := time_ns // 1000) > 0:
+                    file.write(f"{stack} {time_us}\n")
+
+
+def profile_day(day: int, output_directory: Path, *, top: int = 15) -> None:
+    """
+    Profiles parsing and both parts of the given day.
+
+    For every phase, the `cProfile` statistics are written to `dayNN_<phase>.pstats` and the collapsed call stacks to
+    `dayNN_<phase>.collapsed` in `output_directory`, and the `top` functions by cumulative time are printed. The
+    collapsed stacks are recorded in a second run of each phase, so that the two profilers don't measure each other.
+    All phases are run once beforehand, so that one-time costs like lazy imports aren't profiled.
+    """
+
+    output_directory.mkdir(parents=True, exist_ok=True)
+    module = load_solution(day)
+
+    def load_input() -> PuzzleInput:
+        return PuzzleInput.from_path(input_path(day))
+
+    # lazy imports would otherwise dominate the profile of the first phase that triggers them
+    warm_up(module, load_input)
+
+    print(f"Profiling day {day:02} ({SOLUTIONS[day]})")
+    for name, phase in run_phases(module, load_input):
+        profiler = cProfile.Profile()
+        profiler.runcall(phase)
+        stats_path = output_directory / f"day{day:02}_{name}.pstats"
+        profiler.dump_stats(stats_path)
+
+        collector = StackCollector()
+        collector.runcall(phase)
+        collapsed_path = output_directory / f"day{day:02}_{name}.collapsed"
+        collector.dump(collapsed_path)
+
+        print(f"--- {name}: {stats_path}, {collapsed_path}")
+        pstats.Stats(profiler, stream=sys.stdout).strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import mmap
+import re
+from functools import cache
+from importlib.resources import files
+from importlib.resources.abc import Traversable
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+# matches the start of every line but the first, i.e. the position right after every newline
+LINE_START = re.compile(rb"(?<=\n)")
+
+
+class PuzzleInput:
+    """
+    A puzzle input that can be handed out as raw bytes, as lines or as decoded text.
+
+    Inputs read from a file are memory-mapped instead of being read into memory, so `buffer()` and `lines()` don't copy
+    the whole file. The decoded text is only created when `text()` is first called and is cached afterwards.
+
+    Inputs read from a stream (e.g. stdin) are only read as far as they are consumed: `lines()` reads them one line at
+    a time, but then the input can't be iterated again. `buffer()` and `text()` read the rest of the stream at once.
+    """
+
+    # the file the input was read from, if any
+    path: Path | Traversable | None
+    __data: bytes | mmap.mmap
+    __text: str | None
+    __stream: BinaryIO | None
+
+    def __init__(
+        self,
+        data: bytes | mmap.mmap,
+        text: str | None = None,
+        *,
+        stream: BinaryIO | None = None,
+        path: Path | Traversable | None = None,
+    ) -> None:
+        self.path = path
+        self.__data = data
+        self.__text = text
+        self.__stream = stream
+
+    @staticmethod
+    def from_path(path: Path | Traversable) -> PuzzleInput:
+        with path.open("rb") as file:
+            try:
+                # the mapping stays valid after the file is closed
+                return PuzzleInput(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ), path=path)
+            except ValueError:
+                # empty files cannot be mapped
+                return PuzzleInput(b"", path=path)
+
+    @staticmethod
+    def from_str(text: str) -> PuzzleInput:
+        return PuzzleInput(text.encode(), text)
+
+    @staticmethod
+    def from_stream(stream: BinaryIO) -> PuzzleInput:
+        return PuzzleInput(b"", stream=stream)
+
+    @property
+    def streaming(self) -> bool:
+        """
+        Whether the input is read from a stream that hasn't been read yet.
+        """
+
+        return self.__stream is not None
+
+    def __read_stream(self) -> None:
+        if self.__stream is not None:
+            self.__data = self.__stream.read()
+            self.__stream = None
+
+    def __len__(self) -> int:
+        self.__read_stream()
+        return len(self.__data)
+
+    def buffer(self) -> memoryview:
+        """
+        Returns a read-only view of the raw bytes of the input without copying them.
+        """
+
+        self.__read_stream()
+        return memoryview(self.__data).toreadonly()
+
+    def lines(self) -> Iterator[bytes]:
+        """
+        Iterates over the lines of the input as bytes, without their line endings.
+
+        Only one line at a time is copied out of the input.
+        """
+
+        if self.__stream is not None:
+            stream, self.__stream = self.__stream, None
+            for line in stream:
+                yield line.removesuffix(b"\n").rstrip(b"\r")
+            return
+
+        data = self.__data
+        start = 0
+        while start < len(data):
+            end = data.find(b"\n", start)
+            if end == -1:
+                end = len(data)
+            yield data[start:end].rstrip(b"\r")
+            start = end + 1
+
+    def line_chunks(self, count: int, boundary: re.Pattern[bytes] = LINE_START) -> list[tuple[int, int]]:
+        """
+        Splits the input into at most `count` byte ranges of about the same size that start and end on line boundaries.
+
+        Returns the start and end offset of each range, e.g. for processing the ranges in parallel. Instead of at the
+        start of a line, the ranges can also be split at the first match of another `boundary` pattern.
+        """
+
+        self.__read_stream()
+        data = self.__data
+        chunks = []
+        start = 0
+        for i in range(1, count + 1):
+            match = boundary.search(data, max(start + 1, len(data) * i // count)) if i < count else None
+            end = match.start() if match is not None else len(data)
+            if end > start:
+                chunks.append((start, end))
+            start = end
+        return chunks
+
+    def text(self) -> str:
+        """
+        Returns the input decoded as text.
+        """
+
+        if self.__text is None:
+            self.__text = str(self.buffer(), "utf-8")
+        return self.__text
+
+
+def input_path(day: int) -> Traversable:
+    return files("solutions.inputs") / f"{day:02}.txt"
+
+
+@cache
+def get_input(day: int) -> PuzzleInput:
+    """
+    Returns the puzzle input for the given day.
+
+    The input is only loaded once per process, every later call returns the same `PuzzleInput`.
+    """
+
+    return PuzzleInput.from_path(input_path(day))
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import sys
+import traceback
+from functools import partial
+from importlib import import_module
+from queue import Empty
+from time import monotonic, perf_counter
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Iterable, NamedTuple
+
+from . import print_day
+from .cache import AnswerCache
+from .puzzle_input import PuzzleInput, get_input
+
+if TYPE_CHECKING:
+    import multiprocessing
+
+SOLUTIONS = {
+    1: "_01_historian_hysteria",
+    2: "_02_red_nosed_reports",
+    3: "_03_mull_it_over",
+    4: "_04_ceres_search",
+    5: "_05_print_queue",
+    6: "_06_guard_gallivant",
+    7: "_07_bridge_repair",
+    8: "_08_resonant_collinearity",
+    9: "_09_disk_fragmenter",
+    10: "_10_hoof_it",
+    11: "_11_plutonian_pebbles",
+    12: "_12_garden_groups",
+    13: "_13_claw_contraption",
+    14: "_14_restroom_redoubt",
+    15: "_15_warehouse_woes",
+    16: "_16_reindeer_maze",
+}
+
+
+def load_solution(day: int) -> ModuleType:
+    """
+    Imports the solution module for the given day.
+
+    Raises a KeyError if there is no solution for that day yet.
+    """
+
+    return import_module(f".{SOLUTIONS[day]}", package="solutions")
+
+
+class Answers(NamedTuple):
+    part_one: Any
+    part_two: Any
+    cached: bool = False
+
+
+def solve(module: ModuleType, input: PuzzleInput, jobs: int = 1, memory_budget: int | None = None) -> Answers:
+    """
+    Solves both parts of a puzzle using the solver interface of its module.
+
+    Every solution module provides
+    - `parse(input: PuzzleInput)` turning the input into the data both parts work on
+    - `part_one(parsed)` and `part_two(parsed)` returning the answers of the two parts
+
+    The input is parsed only once and shared by both parts, so the parts must not modify the parsed data.
+
+    Modules of line-oriented puzzles can also provide `solve_stream(lines: Iterable[bytes])`, which returns the answers
+    of both parts in a single pass over the lines. It is used for inputs read from a stream, so that they don't have to
+    be read into memory as a whole. Those that keep their lines on disk beyond a memory budget accept it as a
+    `memory_budget` keyword argument (in bytes), which is only passed when a `memory_budget` is given.
+
+    With `jobs > 1`, modules that can split the work on their input provide `solve_parallel(input, jobs)`, which
+    returns the answers of both parts computed in `jobs` worker processes.
+    """
+
+    if jobs > 1 and not input.streaming and hasattr(module, "solve_parallel"):
+        return Answers(*module.solve_parallel(input, jobs))
+    if input.streaming and hasattr(module, "solve_stream"):
+        options = {"memory_budget": memory_budget} if memory_budget is not None else {}
+        return Answers(*module.solve_stream(input.lines(), **options))
+    parsed = module.parse(input)
+    return Answers(module.part_one(parsed), module.part_two(parsed))
+
+
+def solve_day(
+    day: int,
+    cache: AnswerCache | None = None,
+    input: PuzzleInput | None = None,
+    jobs: int = 1,
+    memory_budget: int | None = None,
+) -> Answers:
+    """
+    Solves both parts of the puzzle for the given day, using its puzzle input unless another `input` is given.
+
+    With a `cache`, the answers are looked up by the hash of the input and the module's source first and the
+    computation is skipped entirely on a hit. `jobs` and `memory_budget` are passed on to `solve`.
+    """
+
+    module = load_solution(day)
+    input = input if input is not None else get_input(day)
+    # hashing a streamed input would read it into memory as a whole, so those aren't cached
+    if cache is None or input.streaming:
+        return solve(module, input, jobs, memory_budget)
+
+    key = AnswerCache.key(module, input)
+    if (cached_answers := cache.get(key)) is not None:
+        return Answers(*cached_answers, cached=True)
+    answers = solve(module, input, jobs, memory_budget)
+    cache.put(key, answers.part_one, answers.part_two)
+    return answers
+
+
+class TimedOut(NamedTuple):
+    """
+    Stands in for the answer of a part that didn't finish before the deadline.
+    """
+
+    phase: str
+    elapsed: float
+    # the time it took to finish the phases before the one that timed out
+    timings: dict[str, float]
+
+    def __str__(self) -> str:
+        finished = "".join(f", {phase} took {seconds:.3f}s" for phase, seconds in self.timings.items())
+        return f"timed out in {self.phase} after {self.elapsed:.3f}s{finished}"
+
+
+class Failed(NamedTuple):
+    """
+    Stands in for the answer of a part that wasn't solved because the solution raised an exception or its process died.
+    """
+
+    phase: str
+    reason: str
+
+    def __str__(self) -> str:
+        return f"failed in {self.phase}: {self.reason}"
+
+
+def solve_day_reporting(
+    day: int, cache: AnswerCache | None, queue: multiprocessing.Queue, input: PuzzleInput | None = None
+) -> None:
+    """
+    Solves both parts of the puzzle for the given day like `solve_day`, reporting the progress to `queue`.
+
+    Puts `("start", phase)` when a phase starts, `("done", phase, seconds, result)` when it finishes and finally
+    `("answers", answers)`, or `("error", traceback)` if the solution raised an exception.
+    """
+
+    try:
+        module = load_solution(day)
+        input = input if input is not None else get_input(day)
+        key = AnswerCache.key(module, input) if cache is not None else None
+        if cache is not None and (cached_answers := cache.get(key)) is not None:
+            queue.put(("answers", Answers(*cached_answers, cached=True)))
+            return
+
+        results = {}
+        for phase, function, argument in (
+            ("parse", module.parse, input),
+            ("part_one", module.part_one, None),
+            ("part_two", module.part_two, None),
+        ):
+            queue.put(("start", phase))
+            start = perf_counter()
+            results[phase] = function(results["parse"] if argument is None else argument)
+            # the parsed input is only needed by the parts and may be expensive to send
+            queue.put(("done", phase, perf_counter() - start, results[phase] if phase != "parse" else None))
+
+        answers = Answers(results["part_one"], results["part_two"])
+        if cache is not None:
+            cache.put(key, answers.part_one, answers.part_two)
+        queue.put(("answers", answers))
+    except Exception:
+        queue.put(("error", traceback.format_exc()))
+
+
+def solve_day_with_timeout(
+    day: int, timeout: float, cache: AnswerCache | None = None, input: PuzzleInput | None = None
+) -> Answers:
+    """
+    Solves both parts of the puzzle for the given day in a separate process, which is killed after `timeout` seconds.
+
+    The answers of the parts that didn't finish in time are `TimedOut`, telling which phase was running for how long.
+    If the solution raises an exception or its process dies, the answers of the unfinished parts are `Failed` instead.
+    A given `input` is sent to the process, so it must be picklable, i.e. not be read from a file or a stream.
+    """
+
+    import multiprocessing
+
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=solve_day_reporting, args=(day, cache, queue, input), daemon=True)
+    process.start()
+    deadline = monotonic() + timeout
+
+    timings: dict[str, float] = {}
+    results: dict[str, Any] = {}
+    phase, phase_start = "parse", monotonic()
+    failure: TimedOut | Failed | None = None
+    try:
+        while failure is None and (remaining := deadline - monotonic()) > 0:
+            try:
+                # wake up regularly to notice a process that died without reporting anything
+                message = queue.get(timeout=min(remaining, 1))
+            except Empty:
+                if not process.is_alive() and queue.empty():
+                    failure = Failed(phase, f"exited unexpectedly with exit code {process.exitcode}")
+                continue
+
+            match message:
+                case ("start", phase):
+                    phase_start = monotonic()
+                case ("done", done_phase, seconds, result):
+                    timings[done_phase] = seconds
+                    results[done_phase] = result
+                case ("answers", answers):
+                    return answers
+                case ("error", formatted_traceback):
+                    print(f"Day {day} failed:\n{formatted_traceback}", file=sys.stderr, end="")
+                    failure = Failed(phase, formatted_traceback.strip().splitlines()[-1])
+    finally:
+        process.terminate()
+        process.join()
+
+    if failure is None:
+        failure = TimedOut(phase, monotonic() - phase_start, timings)
+    return Answers(results.get("part_one", failure), results.get("part_two", failure))
+
+
+def print_answers(day: int, answers: Answers) -> None:
+    print_day(day, load_solution(day).TITLE)
+    for part, answer in (("One", answers.part_one), ("Two", answers.part_two)):
+        answer = answer if answer is not None else "not solved yet"
+        print(f"Part {part}: {answer}{' (cached)' if answers.cached else ''}")
+
+
+def run_day(
+    day: int,
+    *,
+    jobs: int = 1,
+    cache: AnswerCache | None = None,
+    timeout: float | None = None,
+    input: PuzzleInput | None = None,
+    memory_budget: int | None = None,
+) -> None:
+    if timeout is not None:
+        print_answers(day, solve_day_with_timeout(day, timeout, cache, input))
+    else:
+        print_answers(day, solve_day(day, cache, input, jobs, memory_budget))
+    if cache is not None:
+        cache.evict()
+
+
+def run_days(
+    days: Iterable[int], *, jobs: int = 1, cache: AnswerCache | None = None, timeout: float | None = None
+) -> None:
+    """
+    Runs the solutions for all given days.
+
+    With `jobs > 1` the days are solved in a pool of `jobs` worker processes. The answers are still printed grouped
+    per day and in the order of `days`, as soon as a day and all days before it have finished.
+
+    With a `timeout`, every day is solved in its own process, one after the other, and killed if it takes longer than
+    `timeout` seconds. The remaining days are still run, also after a day failed.
+    """
+
+    days = list(days)
+    if timeout is not None:
+        for day in days:
+            print_answers(day, solve_day_with_timeout(day, timeout, cache))
+            print()
+    elif jobs <= 1:
+        for day in days:
+            print_answers(day, solve_day(day, cache))
+            print()
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(jobs, len(days))) as executor:
+            # `map` yields the results in submission order, i.e. the slowest day only holds back the days after it
+            for day, answers in zip(days, executor.map(partial(solve_day, cache=cache), days)):
+                print_answers(day, answers)
+                print()
+
+    if cache is not None:
+        cache.evict()
@@ -0,0 +1,128 @@
+"""
+Performance regression tests, timing every day's solution on fixed generated inputs against `baseline.json`.
+
+The timings are compared relative to a calibration workload, so that the baseline can be shared between machines of
+different speeds. A phase fails if it got slower than its baseline by more than `BENCHMARK_THRESHOLD` (a fraction,
+default: 1.0, i.e. twice as slow). After an intended change in performance, rerun the benchmarks with
+`BENCHMARK_UPDATE_BASELINE=1` to record a new baseline.
+
+Every timing is the best of a few samples, and every sample calls the phase often enough to take at least
+`MIN_SAMPLE_TIME`, so that phases of a few microseconds are compared as reliably as long ones.
+
+The timings depend on the load of the machine, so the benchmarks only run with `BENCHMARK=1` (or while updating the
+baseline) and a plain `pytest` run stays deterministic.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Iterator
+
+import pytest
+
+from solutions.bench import format_seconds, run_phases
+from solutions.generators import generate_input
+from solutions.puzzle_input import PuzzleInput
+from solutions.runner import load_solution
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+THRESHOLD = float(os.environ.get("BENCHMARK_THRESHOLD", 1.0))
+UPDATE_BASELINE = os.environ.get("BENCHMARK_UPDATE_BASELINE", "") not in ("", "0")
+RUN_BENCHMARKS = UPDATE_BASELINE or os.environ.get("BENCHMARK", "") not in ("", "0")
+REPEAT = 5
+MIN_SAMPLE_TIME = 0.02
+
+pytestmark = pytest.mark.skipif(not RUN_BENCHMARKS, reason="the benchmarks only run with BENCHMARK=1")
+
+# the scale of each day's input, chosen so that the phases doing most of a day's work take at least a few times
+# `MIN_SAMPLE_TIME` by themselves, while every day still takes well below a second
+SCALES = {
+    1: 200,
+    2: 50,
+    3: 30,
+    4: 60,
+    5: 0.5,
+    6: 0.02,
+    7: 0.002,
+    8: 0.5,
+    9: 0.05,
+    10: 10,
+    11: 0.1,
+    12: 0.1,
+    13: 10,
+    14: 0.01,
+    15: 0.02,
+    16: 0.1,
+}
+
+
+def time_sample(function: Callable[[], object], number: int) -> float:
+    # like `timeit`, the garbage collector is turned off, since when it runs depends on all earlier allocations
+    gc.disable()
+    try:
+        start = perf_counter()
+        for _ in range(number):
+            function()
+        return perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def best_time(function: Callable[[], object]) -> float:
+    """
+    Returns the best time per call of `function` out of `REPEAT` samples of at least `MIN_SAMPLE_TIME` each.
+    """
+
+    # like `bench.warm_up`, an untimed call first, so that caches filled on first use (even on the parsed input) are
+    # warm in every sample instead of only in some
+    function()
+    number = 1
+    while (elapsed := time_sample(function, number)) < MIN_SAMPLE_TIME:
+        # aim a bit above the minimum, so that a sample that happens to be fast doesn't fall below it
+        number = max(number * 2, int(number * 1.5 * MIN_SAMPLE_TIME / max(elapsed, 1e-9)))
+    return min(elapsed, *(time_sample(function, number) for _ in range(REPEAT - 1))) / number
+
+
+def calibration_workload() -> int:
+    return sum(len(str(i)) for i in range(200_000))
+
+
+@pytest.fixture
+def calibration() -> float:
+    # calibrated right before every day, so that a slow period of the machine affects both alike
+    return best_time(calibration_workload)
+
+
+@pytest.fixture(scope="module")
+def baseline() -> Iterator[dict]:
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {"days": {}}
+    yield baseline
+    if UPDATE_BASELINE:
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+@pytest.mark.parametrize("day", sorted(SCALES))
+def test_benchmark(day: int, baseline: dict, calibration: float):
+    data = generate_input(day, SCALES[day]).encode()
+    timings = {name: best_time(phase) for name, phase in run_phases(load_solution(day), lambda: PuzzleInput(data))}
+
+    if UPDATE_BASELINE:
+        # every day keeps its own calibration, so that a single day's baseline can be updated with `-k`
+        baseline["days"][str(day)] = {"scale": SCALES[day], "calibration": calibration, **timings}
+        return
+
+    expected = baseline["days"].get(str(day))
+    if expected is None or expected["scale"] != SCALES[day]:
+        pytest.skip("no baseline, run with BENCHMARK_UPDATE_BASELINE=1 to record one")
+
+    speed = calibration / expected["calibration"]
+    slower = []
+    for name, seconds in timings.items():
+        limit = expected[name] * speed * (1 + THRESHOLD)
+        if seconds > limit:
+            slower.append(f"{name} took {format_seconds(seconds)}, expected at most {format_seconds(limit)}")
+    assert not slower, f"Day {day:02} got slower: " + "; ".join(slower)
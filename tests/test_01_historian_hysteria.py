@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from solutions._01_historian_hysteria import (
+    HistorianLists,
+    parse_array,
+    parse_lines,
+    part_one,
+    part_two,
+    solve_stream,
+)
+from solutions.generators import generate_input
+from solutions.puzzle_input import PuzzleInput
+
+EXAMPLE = "3   4\n4   3\n2   5\n1   3\n3   9\n3   3\n"
+
+
+def test_01_part_one_and_two():
+    lists = parse_lines(PuzzleInput.from_str(EXAMPLE).lines())
+    assert lists == ([1, 2, 3, 3, 3, 4], [3, 3, 3, 4, 5, 9])
+    assert part_one(lists) == 11
+    assert part_two(lists) == 31
+
+
+def test_01_part_one_and_two_numpy():
+    pytest.importorskip("numpy")
+    lists = parse_array(PuzzleInput.from_str(EXAMPLE).buffer())
+    assert lists[0].tolist() == [1, 2, 3, 3, 3, 4]
+    assert lists[1].tolist() == [3, 3, 3, 4, 5, 9]
+    assert part_one(lists) == 11
+    assert part_two(lists) == 31
+
+
+@pytest.mark.parametrize("memory_budget", [100, 500, 10_000])
+def test_01_solve_stream_with_memory_budget(memory_budget: int):
+    assert solve_stream(PuzzleInput.from_str(EXAMPLE).lines(), memory_budget=memory_budget) == (11, 31)
+
+    input = generate_input(1, 0.1)
+    lists = parse_lines(PuzzleInput.from_str(input).lines())
+    answers = solve_stream(PuzzleInput.from_str(input).lines(), memory_budget=memory_budget)
+    assert answers == (part_one(lists), part_two(lists))
+
+
+def test_01_historian_lists():
+    lists = HistorianLists()
+    assert (lists.total_distance, lists.similarity_score) == (0, 0)
+    for left, right in [(3, 4), (4, 3), (2, 5), (1, 3), (3, 9), (3, 3)]:
+        lists.add(left, right)
+    assert len(lists) == 6
+    assert (lists.total_distance, lists.similarity_score) == (11, 31)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_01_historian_lists_incremental(seed: int):
+    rng = random.Random(seed)
+    lists = HistorianLists()
+    left, right = [], []
+    for _ in range(300):
+        pair = rng.randint(0, 100), rng.randint(0, 100)
+        lists.add(*pair)
+        left.append(pair[0])
+        right.append(pair[1])
+        expected = (sorted(left), sorted(right))
+        assert (lists.total_distance, lists.similarity_score) == (part_one(expected), part_two(expected))
@@ -1,8 +1,22 @@
 from __future__ import annotations
 
+import random
+from pathlib import Path
+
 import pytest
 
-from solutions._02_red_nosed_reports import is_report_safe
+from solutions._02_red_nosed_reports import (
+    DECREASING,
+    INCREASING,
+    PackedReports,
+    Report,
+    is_report_safe,
+    is_report_safe_with_problem_dampener,
+    part_one,
+    part_two,
+    solve_parallel,
+)
+from solutions.puzzle_input import PuzzleInput
 
 
 @pytest.mark.parametrize(
@@ -18,3 +32,64 @@ from solutions._02_red_nosed_reports import is_report_safe
 )
 def test_is_report_safe(report, is_safe):
     assert is_report_safe(report) == is_safe
+
+
+def is_report_safe_with_problem_dampener_brute_force(report: Report) -> bool:
+    return any(is_report_safe(report[:i] + report[i + 1 :]) for i in range(len(report)))
+
+
+@pytest.mark.parametrize(
+    "report, is_safe",
+    (
+        pytest.param([7, 6, 4, 2, 1], True, id="safe_decreasing"),
+        pytest.param([1, 2, 7, 8, 9], False, id="unsafe_increase"),
+        pytest.param([9, 7, 6, 2, 1], False, id="unsafe_decrease"),
+        pytest.param([1, 3, 2, 4, 5], True, id="safe_removing_second_level"),
+        pytest.param([8, 6, 4, 4, 1], True, id="safe_removing_third_level"),
+        pytest.param([1, 3, 6, 7, 9], True, id="safe_increasing"),
+    ),
+)
+def test_is_report_safe_with_problem_dampener(report, is_safe):
+    assert is_report_safe_with_problem_dampener(report) == is_safe
+
+
+def random_reports(count: int) -> list[Report]:
+    rng = random.Random(2)
+    reports = [[], [1], [5, 5]]
+    for _ in range(count):
+        # mostly safe steps in one direction, with a few random ones in between
+        direction = rng.choice((-1, 1))
+        report = [rng.randint(0, 10)]
+        for _ in range(rng.randint(1, 8)):
+            report.append(report[-1] + (direction * rng.randint(1, 3) if rng.random() < 0.85 else rng.randint(-5, 5)))
+        reports.append(report)
+    return reports
+
+
+def test_is_report_safe_with_problem_dampener_matches_brute_force():
+    for report in random_reports(20_000):
+        assert is_report_safe_with_problem_dampener(report) == is_report_safe_with_problem_dampener_brute_force(report)
+
+
+def test_packed_reports():
+    pytest.importorskip("numpy")
+    reports = random_reports(5_000)
+    text = "".join(" ".join(map(str, report)) + "\n" for report in reports)
+    for packed in (PackedReports.from_reports(reports), PackedReports.from_buffer(memoryview(text.encode()))):
+        assert len(packed) == len(reports)
+        assert part_one(packed) == part_one(reports)
+        assert part_two(packed) == part_two(reports)
+        safe = packed.safe(INCREASING) | packed.safe(DECREASING)
+        assert safe.tolist() == [is_report_safe(report) for report in reports]
+        safe = packed.safe_with_problem_dampener(INCREASING) | packed.safe_with_problem_dampener(DECREASING)
+        assert safe.tolist() == [is_report_safe_with_problem_dampener(report) for report in reports]
+
+
+def test_solve_parallel(tmp_path: Path):
+    reports = random_reports(1_000)
+    text = "".join(" ".join(map(str, report)) + "\n" for report in reports)
+    path = tmp_path / "input.txt"
+    path.write_text(text)
+    expected = (part_one(reports), part_two(reports))
+    assert solve_parallel(PuzzleInput.from_path(path), 2) == expected
+    assert solve_parallel(PuzzleInput.from_str(text), 3) == expected
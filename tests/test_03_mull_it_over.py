@@ -1,10 +1,23 @@
 from __future__ import annotations
 
+import random
+from pathlib import Path
+
+import pytest
+
 from solutions._03_mull_it_over import (
+    CHUNK_BOUNDARY,
     find_enabled_uncorrupted_mul_instructions,
     find_uncorrupted_mul_instructions,
+    merge_instruction_sums,
     mul,  # noqa: F401 # needed for eval below
+    parse,
+    run_instructions,
+    scan_instructions,
+    solve_parallel,
 )
+from solutions.generators import generate_input
+from solutions.puzzle_input import PuzzleInput
 
 
 def test_find_uncorrupted_mul_instructions():
@@ -33,3 +46,47 @@ def test_find_enabled_uncorrupted_mul_instructions():
         sum(eval(instruction) for instruction in enabled_uncorrupted_mul_instructions)
         == 48
     )
+
+
+def test_run_instructions():
+    assert run_instructions("xmul(2,4)%&mul[3,7]!@^do_not_mul(5,5)+mul(32,64]then(mul(11,8)mul(8,5))") == (161, 161)
+    assert run_instructions("xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))") == (161, 48)
+    assert run_instructions("don't()mul(1,2)don't()mul(3,4)do()do()mul(5,6)") == (44, 30)
+    assert run_instructions("") == (0, 0)
+
+
+@pytest.mark.parametrize("count", [1, 2, 7, 100, 10_000])
+def test_instruction_chunks(count: int):
+    memory = generate_input(3, 0.2).encode()
+    chunks = PuzzleInput(memory).line_chunks(count, CHUNK_BOUNDARY)
+    assert [start for start, _ in chunks[1:]] == [end for _, end in chunks[:-1]]
+    assert chunks[0][0] == 0 and chunks[-1][1] == len(memory)
+    parts = [scan_instructions(memory, start, end) for start, end in chunks]
+    assert merge_instruction_sums(parts) == run_instructions(memory.decode())
+
+
+def test_merge_instruction_sums_matches_random_splits():
+    memory = "mul(2,3)don't()mul(4,5)mul(1,1)do()mul(6,7)don't()"
+    # splitting inside an instruction would lose it, so only split right before one
+    boundaries = [i for i, character in enumerate(memory) if character in "md"]
+    rng = random.Random(0)
+    for _ in range(100):
+        bounds = [0, *sorted(rng.sample(boundaries, rng.randint(1, 5))), len(memory)]
+        parts = [scan_instructions(memory, start, end) for start, end in zip(bounds, bounds[1:])]
+        assert merge_instruction_sums(parts) == run_instructions(memory) == (69, 48)
+
+
+def test_solve_parallel(tmp_path: Path):
+    text = generate_input(3, 0.5)
+    path = tmp_path / "input.txt"
+    path.write_text(text)
+    expected = run_instructions(text)
+    assert solve_parallel(PuzzleInput.from_path(path), 2) == expected
+    assert solve_parallel(PuzzleInput.from_str(text), 3) == expected
+
+
+def test_parse_scans_bytes(tmp_path: Path):
+    text = generate_input(3, 0.5)
+    path = tmp_path / "input.txt"
+    path.write_text(text)
+    assert parse(PuzzleInput.from_path(path)) == parse(PuzzleInput.from_str(text)) == run_instructions(text)
@@ -1,13 +1,29 @@
 from __future__ import annotations
 
+import random
+
+import pytest
+
+from solutions import _04_ceres_search
 from solutions._04_ceres_search import (
+    WordAutomaton,
+    WordSearch,
+    count_word_array,
+    count_words,
     count_x_mas,
+    count_x_mas_array,
     count_xmas,
     count_xmas_diagonal,
     count_xmas_diagonal_reverse,
     count_xmas_horizontal,
     count_xmas_vertical,
+    parse,
+    parse_array,
+    part_one,
+    part_two,
 )
+from solutions.generators import generate_input
+from solutions.puzzle_input import PuzzleInput
 
 
 def test_count_xmas():
@@ -76,3 +92,74 @@ M.M.M.M.M.
 """
     word_search = tuple(tuple(line) for line in input.splitlines())
     assert count_x_mas(word_search) == 9
+
+
+@pytest.mark.parametrize("band_rows", [1, 3, 1024])
+@pytest.mark.parametrize("scale", [0.01, 0.2])
+def test_word_search_array(monkeypatch: pytest.MonkeyPatch, band_rows: int, scale: float):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(_04_ceres_search, "BAND_ROWS", band_rows)
+    text = generate_input(4, scale, seed=band_rows)
+    word_search = tuple(tuple(line) for line in text.splitlines())
+    array = parse(PuzzleInput.from_str(text))
+    assert count_word_array(array, "XMAS") == count_xmas(word_search)
+    assert count_x_mas_array(array) == count_x_mas(word_search)
+
+
+def test_parse_array():
+    pytest.importorskip("numpy")
+    assert parse_array(memoryview(b"XMAS\nSAMX\nAAAA")).tobytes() == b"XMASSAMXAAAA"
+    assert parse_array(memoryview(b"XMAS\nSAMX\n")).shape == (2, 4)
+    assert parse_array(memoryview(b"")).shape == (0, 0)
+    assert count_word_array(parse_array(memoryview(b"XM\n")), "XMAS") == 0
+    with pytest.raises(ValueError):
+        parse_array(memoryview(b"XMAS\nSAM\n"))
+
+
+def test_word_automaton():
+    automaton = WordAutomaton(["he", "she", "his", "hers", "e"])
+    assert automaton.count(["ushers", "hishe"]) == [2, 2, 1, 1, 2]
+    assert automaton.count([]) == [0, 0, 0, 0, 0]
+
+
+def random_words(count: int) -> list[str]:
+    rng = random.Random(0)
+    return ["XMAS", "MAS", "X", "SAS", *("".join(rng.choices("XMAS", k=rng.randint(2, 6))) for _ in range(count))]
+
+
+def test_count_words():
+    text = generate_input(4, 0.05)
+    word_search = tuple(tuple(line) for line in text.splitlines())
+    counts = count_words(word_search, random_words(50))
+    assert counts["XMAS"] == count_xmas(word_search)
+    assert counts["X"] == 8 * text.count("X")
+
+
+def test_count_words_matches_word_search_array():
+    pytest.importorskip("numpy")
+    text = generate_input(4, 0.05)
+    word_search = tuple(tuple(line) for line in text.splitlines())
+    array = parse(PuzzleInput.from_str(text))
+    words = random_words(50)
+    expected = {word: count_word_array(array, word) for word in words}
+    assert count_words(word_search, words) == count_words(array, words) == expected
+
+
+def test_word_search():
+    word_search = WordSearch(["ABC", "DEF"])
+    assert word_search.rows == ("ABC", "DEF")
+    assert word_search.columns.split() == ["AD", "BE", "CF"]
+    assert word_search.diagonals.split() == ["D", "AE", "BF", "C"]
+    assert word_search.anti_diagonals.split() == ["A", "BD", "CE", "F"]
+    assert WordSearch.from_grid(word_search) is word_search
+    assert WordSearch.from_grid((("A", "B", "C"), ("D", "E", "F"))).families == word_search.families
+    # overlapping occurrences are counted, too
+    assert WordSearch(["SASAS"]).count("SAS") == 4
+
+
+def test_word_search_parts():
+    text = generate_input(4, 0.05)
+    word_search = WordSearch(text.splitlines())
+    grid = tuple(tuple(line) for line in text.splitlines())
+    assert part_one(word_search) == count_xmas(grid) == count_words(grid, ["XMAS"])["XMAS"]
+    assert part_two(word_search) == count_x_mas(grid)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from solutions._06_guard_gallivant import Map
+from solutions._06_guard_gallivant import Map, parse, part_one, part_two
+from solutions.puzzle_input import PuzzleInput
 
 input = """....#.....
 .........#
@@ -41,3 +42,9 @@ def test_map_find_possible_obstructions() -> None:
     m.find_possible_obstructions()
     assert m.count_possible_obstructions() == 6
 
+
+def test_parts_share_parsed_map() -> None:
+    m = parse(PuzzleInput.from_str(input))
+    assert part_one(m) == 41
+    assert part_two(m) == 6
+    assert str(m) == input
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from solutions._07_bridge_repair import Equation, Operator, parse_input
+from solutions._07_bridge_repair import Equation, Operator, parse_input, part_one, part_two
 
 input = """190: 10 19
 3267: 81 40 27
@@ -64,3 +64,10 @@ def test_07_find_possible_operators_with_concat():
     assert equations[6].operators == [[Operator.CONCAT, Operator.ADD]]
     assert equations[7].operators == []
     assert equations[8].operators == [[Operator.ADD, Operator.MULTIPLY, Operator.ADD]]
+
+
+def test_07_parts_keep_parsed_equations():
+    equations = parse_input(input)
+    assert part_two(equations) == 11387
+    assert part_one(equations) == 3749
+    assert equations == parse_input(input)
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import pytest
 
-from solutions._13_claw_contraption import Machine
+from solutions._13_claw_contraption import Machine, parse, part_one, part_two
+from solutions.puzzle_input import PuzzleInput
 
 
 @pytest.mark.parametrize(
@@ -97,3 +98,30 @@ def test_13_part2(machine_input: str, solvable: bool):
     machine = Machine(machine_input)
     assert str(machine) == machine_input
     assert (machine.calculate_token_cost(offset=10000000000000) > 0) == solvable
+
+
+def test_13_parts_share_parsed_input():
+    input = """\
+Button A: X+94, Y+34
+Button B: X+22, Y+67
+Prize: X=8400, Y=5400
+
+Button A: X+26, Y+66
+Button B: X+67, Y+21
+Prize: X=12748, Y=12176
+
+Button A: X+17, Y+86
+Button B: X+84, Y+37
+Prize: X=7870, Y=6450
+
+Button A: X+69, Y+23
+Button B: X+27, Y+71
+Prize: X=18641, Y=10279\
+"""
+    machines = parse(PuzzleInput.from_str(input))
+    assert part_one(machines) == 480
+    part_two_token_cost = part_two(machines)
+    assert part_two_token_cost > 0
+    # solving part two must not change the parsed machines
+    assert part_one(machines) == 480
+    assert part_two(machines) == part_two_token_cost
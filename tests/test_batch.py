@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from solutions.batch import solve_files
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_solve_files(tmp_path: Path, jobs: int):
+    (tmp_path / "a.txt").write_text("3   4\n4   3\n2   5\n1   3\n3   9\n3   3\n")
+    (tmp_path / "b.txt").write_text("1   1\n")
+    (tmp_path / "broken.txt").write_text("1\n")
+    paths = sorted(str(path) for path in tmp_path.iterdir())
+
+    results = {Path(result["input"]).name: result for result in solve_files(1, paths, jobs=jobs)}
+    assert (results["a.txt"]["part_one"], results["a.txt"]["part_two"]) == (11, 31)
+    assert (results["b.txt"]["part_one"], results["b.txt"]["part_two"]) == (0, 1)
+    assert "error" in results["broken.txt"]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_solve_files_without_inputs(jobs: int):
+    assert list(solve_files(1, [], jobs=jobs)) == []
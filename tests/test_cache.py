@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+from solutions import _01_historian_hysteria, _02_red_nosed_reports
+from solutions.cache import AnswerCache
+from solutions.puzzle_input import PuzzleInput
+
+
+def test_answer_cache_key():
+    input = PuzzleInput.from_str("3   4\n4   3\n")
+    key = AnswerCache.key(_01_historian_hysteria, input)
+    assert key == AnswerCache.key(_01_historian_hysteria, PuzzleInput.from_str("3   4\n4   3\n"))
+    assert key != AnswerCache.key(_01_historian_hysteria, PuzzleInput.from_str("3   4\n4   4\n"))
+    assert key != AnswerCache.key(_02_red_nosed_reports, input)
+
+
+def test_answer_cache_get_put(tmp_path: Path):
+    cache = AnswerCache(tmp_path / "cache")
+    assert cache.get("key") is None
+    cache.put("key", 11, None)
+    assert cache.get("key") == (11, None)
+
+
+def test_answer_cache_evict_by_age(tmp_path: Path):
+    cache = AnswerCache(tmp_path, max_age=60)
+    cache.put("old", 1, 2)
+    cache.put("new", 3, 4)
+    an_hour_ago = time.time() - 3600
+    os.utime(tmp_path / "old.json", (an_hour_ago, an_hour_ago))
+
+    assert cache.evict() == 1
+    assert cache.get("old") is None
+    assert cache.get("new") == (3, 4)
+
+
+def test_answer_cache_evict_by_size(tmp_path: Path):
+    cache = AnswerCache(tmp_path)
+    for i, key in enumerate(("a", "b", "c")):
+        cache.put(key, i, i)
+        os.utime(tmp_path / f"{key}.json", (1000 + i, 1000 + i))
+    # reading an entry marks it as recently used
+    assert cache.get("a") == (0, 0)
+
+    cache.max_size = (tmp_path / "a.json").stat().st_size * 2
+    assert cache.evict() == 1
+    assert cache.get("b") is None
+    assert cache.get("a") == (0, 0)
+    assert cache.get("c") == (2, 2)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from solutions.bench import fit_exponent
+from solutions.generators import GENERATORS, generate_input, guard_path
+from solutions.puzzle_input import PuzzleInput
+from solutions.runner import SOLUTIONS, load_solution, solve
+
+
+def test_generators_cover_all_solutions():
+    assert GENERATORS.keys() == SOLUTIONS.keys()
+
+
+@pytest.mark.parametrize("day", sorted(GENERATORS))
+def test_generated_input_is_solvable(day: int):
+    input = generate_input(day, 0.01)
+    assert input == generate_input(day, 0.01)
+    assert input != generate_input(day, 0.01, seed=1)
+    answers = solve(load_solution(day), PuzzleInput.from_str(input))
+    assert answers.part_one is not None
+
+
+@pytest.mark.parametrize("day", sorted(GENERATORS))
+def test_generated_input_grows_with_scale(day: int):
+    assert len(generate_input(day, 0.1)) < len(generate_input(day, 1))
+
+
+def test_fit_exponent():
+    sizes = [1000, 2000, 4000, 8000]
+    assert fit_exponent(sizes, [3e-6 * size for size in sizes]) == pytest.approx(1)
+    assert fit_exponent(sizes, [3e-9 * size**2 for size in sizes]) == pytest.approx(2)
+    assert math.isnan(fit_exponent([1000, 1000], [1.0, 2.0]))
+
+
+def test_generated_reports_get_longer_with_scale():
+    def longest_report(scale: float) -> int:
+        return max(len(line.split()) for line in generate_input(2, scale).splitlines())
+
+    assert longest_report(10) > 5 * longest_report(1)
+
+
+def test_generated_guard_walks_far():
+    lines = generate_input(6, 1).splitlines()
+    y = next(y for y, line in enumerate(lines) if "^" in line)
+    path = guard_path([list(line) for line in lines], lines[y].index("^"), y)
+    assert path is not None and len(path) > len(lines) ** 2 // 8
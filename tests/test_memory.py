@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import tracemalloc
+
+from solutions.memory import MemoryResult, PeakSnapshots, PhaseMemory, check_memory_budget
+
+
+def allocate_and_free() -> int:
+    numbers = [[i] for i in range(10_000)]
+    return len(numbers)
+
+
+def test_peak_snapshots():
+    snapshots = PeakSnapshots()
+    tracemalloc.start()
+    try:
+        snapshots.runcall(allocate_and_free)
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # the list is freed again, but the snapshot still shows where the peak was allocated
+    sites = snapshots.top_sites(1)
+    assert sites[0].traceback[0].filename == __file__
+    # the list is allocated on the first line of the function's body
+    assert sites[0].traceback[0].lineno == allocate_and_free.__code__.co_firstlineno + 1
+    assert sites[0].size > current
+
+
+def test_check_memory_budget():
+    phases = [PhaseMemory("parse", 2000, []), PhaseMemory("part_one", 500, [])]
+    result = MemoryResult(1, "_01_historian_hysteria", phases)
+    assert check_memory_budget([result], 1000) == [(result, "parse", 2000)]
+    assert check_memory_budget([result], 2000) == []
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from solutions.profiling import StackCollector
+
+
+def inner() -> int:
+    return sum(range(10_000))
+
+
+def outer() -> int:
+    return inner() + inner()
+
+
+def test_stack_collector(tmp_path: Path):
+    collector = StackCollector()
+    collector.runcall(outer)
+
+    stacks = list(collector.stacks)
+    outer_frame = f"test_profiling.py:outer:{outer.__code__.co_firstlineno}"
+    inner_frame = f"test_profiling.py:inner:{inner.__code__.co_firstlineno}"
+    assert any(stack.endswith(outer_frame) for stack in stacks)
+    assert any(stack.endswith(f"{outer_frame};{inner_frame};builtins.sum") for stack in stacks)
+
+    path = tmp_path / "stacks.collapsed"
+    collector.dump(path)
+    for line in path.read_text().splitlines():
+        stack, time_us = line.rsplit(" ", 1)
+        assert stack in collector.stacks
+        assert int(time_us) > 0
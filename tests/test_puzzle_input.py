@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import io
+import re
+from pathlib import Path
+
+from solutions.puzzle_input import PuzzleInput
+
+
+def test_puzzle_input_from_path(tmp_path: Path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"3   4\r\n4   3\n2   5")
+    input = PuzzleInput.from_path(path)
+    assert len(input) == 18
+    assert bytes(input.buffer()) == b"3   4\r\n4   3\n2   5"
+    assert list(input.lines()) == [b"3   4", b"4   3", b"2   5"]
+    assert input.text() == "3   4\r\n4   3\n2   5"
+
+
+def test_puzzle_input_from_empty_path(tmp_path: Path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"")
+    input = PuzzleInput.from_path(path)
+    assert len(input) == 0
+    assert list(input.lines()) == []
+    assert input.text() == ""
+
+
+def test_puzzle_input_from_str():
+    input = PuzzleInput.from_str("a\nb\n")
+    assert list(input.lines()) == [b"a", b"b"]
+    assert input.text() == "a\nb\n"
+
+
+def test_puzzle_input_from_stream():
+    input = PuzzleInput.from_stream(io.BytesIO(b"3   4\r\n4   3\n2   5"))
+    assert input.streaming
+    assert list(input.lines()) == [b"3   4", b"4   3", b"2   5"]
+    assert not input.streaming
+    assert list(input.lines()) == []
+
+    input = PuzzleInput.from_stream(io.BytesIO(b"a\nb\n"))
+    assert input.text() == "a\nb\n"
+    assert not input.streaming
+    assert list(input.lines()) == [b"a", b"b"]
+
+
+def test_puzzle_input_line_chunks():
+    input = PuzzleInput.from_str("aa\nb\ncccc\n\ndd")
+    for count in range(1, 8):
+        chunks = input.line_chunks(count)
+        assert len(chunks) <= count
+        assert b"".join(bytes(input.buffer()[start:end]) for start, end in chunks) == bytes(input.buffer())
+        assert all(input.buffer()[end - 1] == ord("\n") for _, end in chunks[:-1])
+    assert PuzzleInput.from_str("").line_chunks(3) == []
+
+
+def test_puzzle_input_line_chunks_with_boundary():
+    input = PuzzleInput.from_str("xaxxaaxxxa")
+    for count in range(1, 8):
+        chunks = input.line_chunks(count, re.compile(b"a"))
+        assert len(chunks) <= count
+        assert b"".join(bytes(input.buffer()[start:end]) for start, end in chunks) == bytes(input.buffer())
+        assert all(input.buffer()[start] == ord("a") for start, _ in chunks[1:])
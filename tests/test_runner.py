@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from solutions.generators import generate_input
+from solutions.puzzle_input import PuzzleInput
+from solutions.runner import SOLUTIONS, Answers, Failed, TimedOut, load_solution, solve, solve_day_with_timeout
+
+
+EXAMPLE_INPUT = "3   4\n4   3\n2   5\n1   3\n3   9\n3   3\n"
+
+
+def test_solve_day_with_timeout():
+    assert solve_day_with_timeout(1, 30, input=PuzzleInput.from_str(EXAMPLE_INPUT)) == Answers(11, 31)
+
+
+def test_solve_day_with_timeout_timed_out():
+    answers = solve_day_with_timeout(1, 0, input=PuzzleInput.from_str(EXAMPLE_INPUT))
+    assert isinstance(answers.part_one, TimedOut)
+    assert answers.part_one.phase == "parse"
+    assert answers.part_two == answers.part_one
+
+
+def test_solve_day_with_timeout_failed():
+    answers = solve_day_with_timeout(1, 30, input=PuzzleInput.from_str("1\n"))
+    assert isinstance(answers.part_one, Failed)
+    assert answers.part_one.phase == "parse"
+    assert answers.part_two == answers.part_one
+
+
+def test_timed_out_str():
+    timed_out = TimedOut("part_two", 10.5, {"parse": 0.25, "part_one": 1.0})
+    assert str(timed_out) == "timed out in part_two after 10.500s, parse took 0.250s, part_one took 1.000s"
+
+
+@pytest.mark.parametrize("day", [day for day in SOLUTIONS if hasattr(load_solution(day), "solve_stream")])
+def test_solve_stream(day: int):
+    text = generate_input(day, 0.01)
+    module = load_solution(day)
+    stream = io.BytesIO(text.encode())
+    assert solve(module, PuzzleInput.from_stream(stream)) == solve(module, PuzzleInput.from_str(text))
+
+
+def test_solve_stream_with_memory_budget(monkeypatch: pytest.MonkeyPatch):
+    module = load_solution(1)
+    runs = []
+    write_run = module.write_run
+    monkeypatch.setattr(module, "write_run", lambda ids: runs.append(len(ids)) or write_run(ids))
+    input = PuzzleInput.from_stream(io.BytesIO(EXAMPLE_INPUT.encode()))
+    # a budget for two IDs of each list spills the six lines to disk in three runs per list
+    assert solve(module, input, memory_budget=4 * module.BYTES_PER_ID) == Answers(11, 31)
+    assert runs == [2] * 6